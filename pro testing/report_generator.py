@@ -7,24 +7,57 @@ from datetime import datetime
 import json
 
 class ReportGenerator:
-    def __init__(self, base_url):
-        self.base = base_url
+    def __init__(self, base_url: str):
+        self.base: str = base_url
+        self._base_len: int = len(base_url)
+        self.timestamp: str | None = None
     
-    def generate_brief_report(self, visited, all_elements, all_scenarios, all_results, analysis):
+    def _short(self, url: str) -> str:
+        """Strip the base URL prefix for display"""
+        return (url[self._base_len:] if url.startswith(self.base) else url) or '/'
+    
+    def generate_brief_report(self, visited: set[str], all_elements: list[dict], all_scenarios: list[dict],
+                              all_results: list[dict], analysis: dict) -> str:
         """Generate brief web-friendly report"""
-        total = len(all_results)
-        passed = sum(1 for r in all_results if r['final_status'] == 'passed')
-        failed = sum(1 for r in all_results if r['final_status'] == 'failed')
+        total: int = len(all_results)
+        passed: int = 0
+        failed: int = 0
+        # A scenario counts as passed/failed if any of its results did; samples show its first result
+        passed_sids: set[str] = set()
+        failed_sids: set[str] = set()
+        status_by_sid: dict[str, str] = {}
+        # Failed tests bucketed by severity as (title, short url, reason) rows
+        severity_buckets: dict[str, list[tuple[str, str, str]]] = {'high': [], 'medium': [], 'low': []}
+        for r in all_results:
+            if r['final_status'] == 'passed':
+                passed += 1
+                passed_sids.add(r['scenario_id'])
+            elif r['final_status'] == 'failed':
+                failed += 1
+                failed_sids.add(r['scenario_id'])
+                llm_analysis = r['llm_analysis']
+                bucket = severity_buckets.get(llm_analysis.get('severity'))
+                if bucket is not None:
+                    bucket.append((
+                        r['title'][:70],
+                        self._short(r.get('page_url', '')),
+                        llm_analysis.get('reason', 'N/A')[:80]
+                    ))
+            status_by_sid.setdefault(r['scenario_id'], r['final_status'])
         rate = round((passed / total * 100) if total > 0 else 0, 2)
         
-        lines = []
+        now = datetime.now()
+        date_str = now.strftime('%B %d, %Y at %I:%M %p')
+        self.timestamp = now.strftime('%Y%m%d_%H%M%S')
+        
+        lines: list[str] = []
         
         # Header
         lines.append("=" * 90)
         lines.append("QA TEST REPORT".center(90))
         lines.append("=" * 90)
         lines.append(f"Website: {self.base}")
-        lines.append(f"Date: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}")
+        lines.append(f"Date: {date_str}")
         lines.append(f"Quality: {analysis.get('overall_quality', 'unknown').upper()}")
         lines.append("")
         
@@ -54,7 +87,7 @@ class ReportGenerator:
                 page_failed = sum(1 for r in page_results if r['final_status'] == 'failed')
                 pass_rate = (page_passed / len(page_results) * 100) if page_results else 0
                 
-                short_url = page.replace(self.base, '') or '/'
+                short_url = self._short(page)
                 status = "✓" if page_failed == 0 else "⚠"
                 
                 lines.append(f"{status} {short_url}")
@@ -77,34 +110,31 @@ class ReportGenerator:
         lines.append("")
         
         # Failed Tests
-        fails = [r for r in all_results if r['final_status'] == 'failed']
-        if fails:
+        if failed:
             lines.append("─" * 90)
-            lines.append(f"FAILED TESTS ({len(fails)} total)")
+            lines.append(f"FAILED TESTS ({failed} total)")
             lines.append("─" * 90)
             
-            high_severity = [f for f in fails if f['llm_analysis'].get('severity') == 'high']
-            medium_severity = [f for f in fails if f['llm_analysis'].get('severity') == 'medium']
-            low_severity = [f for f in fails if f['llm_analysis'].get('severity') == 'low']
+            high_severity = severity_buckets['high']
+            medium_severity = severity_buckets['medium']
+            low_severity = severity_buckets['low']
             
             if high_severity:
                 lines.append(f"\n🔴 HIGH SEVERITY ({len(high_severity)})")
-                for t in high_severity[:5]:
-                    short_url = t.get('page_url', '').replace(self.base, '') or '/'
-                    lines.append(f"  • {t['title'][:70]}")
-                    lines.append(f"    Page: {short_url} | {t['llm_analysis'].get('reason', 'N/A')[:80]}")
+                for title, short_url, reason in high_severity[:5]:
+                    lines.append(f"  • {title}")
+                    lines.append(f"    Page: {short_url} | {reason}")
             
             if medium_severity:
                 lines.append(f"\n🟡 MEDIUM SEVERITY ({len(medium_severity)})")
-                for t in medium_severity[:3]:
-                    short_url = t.get('page_url', '').replace(self.base, '') or '/'
-                    lines.append(f"  • {t['title'][:70]}")
-                    lines.append(f"    Page: {short_url} | {t['llm_analysis'].get('reason', 'N/A')[:80]}")
+                for title, short_url, reason in medium_severity[:3]:
+                    lines.append(f"  • {title}")
+                    lines.append(f"    Page: {short_url} | {reason}")
             
             if low_severity and len(high_severity) + len(medium_severity) < 5:
                 lines.append(f"\n🟢 LOW SEVERITY ({len(low_severity)})")
-                for t in low_severity[:2]:
-                    lines.append(f"  • {t['title'][:70]}")
+                for title, _, _ in low_severity[:2]:
+                    lines.append(f"  • {title}")
             
             lines.append("")
         
@@ -133,8 +163,8 @@ class ReportGenerator:
         lines.append("TEST SCENARIOS EXECUTED")
         lines.append("─" * 90)
         
-        passed_scenarios = [s for s in all_scenarios if any(r['scenario_id'] == s['scenario_id'] and r['final_status'] == 'passed' for r in all_results)]
-        failed_scenarios = [s for s in all_scenarios if any(r['scenario_id'] == s['scenario_id'] and r['final_status'] == 'failed' for r in all_results)]
+        passed_scenarios = [s for s in all_scenarios if s['scenario_id'] in passed_sids]
+        failed_scenarios = [s for s in all_scenarios if s['scenario_id'] in failed_sids]
         
         lines.append(f"✓ {len(passed_scenarios)} scenarios passed")
         lines.append(f"✗ {len(failed_scenarios)} scenarios failed")
@@ -147,11 +177,11 @@ class ReportGenerator:
             if stype not in scenario_samples:
                 scenario_samples[stype] = []
             if len(scenario_samples[stype]) < 2:
-                result_status = "○"
-                for r in all_results:
-                    if r['scenario_id'] == s['scenario_id']:
-                        result_status = "✓" if r['final_status'] == 'passed' else "✗"
-                        break
+                status = status_by_sid.get(s['scenario_id'])
+                if status is None:
+                    result_status = "○"
+                else:
+                    result_status = "✓" if status == 'passed' else "✗"
                 scenario_samples[stype].append(f"{result_status} {s['title'][:65]}")
         
         for stype, samples in sorted(scenario_samples.items()):
@@ -162,14 +192,14 @@ class ReportGenerator:
         
         # Footer
         lines.append("=" * 90)
-        lines.append(f"Full test data exported to JSON files with timestamp {datetime.now().strftime('%Y%m%d_%H%M%S')}")
+        lines.append(f"Full test data exported to JSON files with timestamp {self.timestamp}")
         lines.append("=" * 90)
         
         return "\n".join(lines)
     
-    def save_json_data(self, elements, scenarios, results):
-        """Save all data as JSON files"""
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    def save_json_data(self, elements, scenarios, results, timestamp=None):
+        """Save all data as JSON files (reuses the report timestamp when available)"""
+        timestamp = timestamp or self.timestamp or datetime.now().strftime('%Y%m%d_%H%M%S')
         
         with open(f'elements_{timestamp}.json', 'w', encoding='utf-8') as f:
             json.dump(elements, f, indent=2, ensure_ascii=False)
@@ -4,201 +4,141 @@ Tests multi-step user journeys and workflows
 """
 
 import time
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+_REGISTER_WORDS = ('register', 'sign up', 'signup')
+_SUBMIT_WORDS = ('submit', 'send')
+_SEARCH_WORDS = ('search', 'find')
+
+# Workflow step templates: (role, action, data, description)
+_LOGIN_TEMPLATE = (
+    ('email', 'fill', 'testuser@example.com', 'Enter email address'),
+    ('password', 'fill', 'TestPassword123!', 'Enter password'),
+    ('login_btn', 'click', '', 'Click login button'),
+)
+_REGISTRATION_TEMPLATE = (
+    ('full_name', 'fill', 'John Doe', 'Enter full name'),
+    ('email', 'fill', 'newuser@example.com', 'Enter email address'),
+    ('password', 'fill', 'SecurePass123!', 'Enter password'),
+    ('register_btn', 'click', '', 'Click registration button'),
+)
+_CONTACT_TEMPLATE = (
+    ('name', 'fill', 'Jane Smith', 'Enter name'),
+    ('email', 'fill', 'jane@example.com', 'Enter email'),
+    ('message', 'fill', 'This is a test message for the contact form.', 'Enter message'),
+    ('submit_btn', 'click', '', 'Submit form'),
+)
+_SEARCH_TEMPLATE = (
+    ('search', 'fill', 'test query', 'Enter search query'),
+    ('search_btn', 'click', '', 'Click search button'),
+)
+
+
+def _build_steps(template, first):
+    """Build workflow steps from a template for the roles found on the page"""
+    return [
+        {
+            'action': action,
+            'selector': first[role]['selector'],
+            'data': data,
+            'description': description
+        }
+        for role, action, data, description in template
+        if role in first
+    ]
 
 class WorkflowTester:
     def __init__(self, browser_manager, llm_manager):
         self.browser = browser_manager
         self.llm = llm_manager
         self.workflows = []
+        self._screenshot_cache = {}
+        self._avg_step_wait = 0.05  # Adaptive pause between steps (seconds)
+    
+    def _classify_elements(self, elements):
+        """Find the first element for each workflow role in a single pass"""
+        first = {}
+        
+        for e in elements:
+            etype = e['type']
+            if etype == 'input':
+                name = e.get('name', '').lower()
+                if 'email' in name:
+                    first.setdefault('email', e)
+                if 'name' in name:
+                    first.setdefault('name', e)
+                    if 'email' not in name:
+                        first.setdefault('full_name', e)
+                if e.get('input_type') == 'password':
+                    first.setdefault('password', e)
+                placeholder = e.get('placeholder', '').lower()
+                if any(word in placeholder for word in _SEARCH_WORDS):
+                    first.setdefault('search', e)
+            elif etype == 'button':
+                text = e.get('text', '').lower()
+                if 'login' in text:
+                    first.setdefault('login_btn', e)
+                if any(word in text for word in _REGISTER_WORDS):
+                    first.setdefault('register_btn', e)
+                if any(word in text for word in _SUBMIT_WORDS):
+                    first.setdefault('submit_btn', e)
+                if 'search' in text:
+                    first.setdefault('search_btn', e)
+            elif etype == 'textarea':
+                first.setdefault('message', e)
+        
+        return first
     
     def detect_workflows(self, elements, page_url):
         """Detect common workflows from elements"""
         workflows = []
+        first = self._classify_elements(elements)
         
         # Detect login workflow
-        has_email = any(e['type'] == 'input' and 'email' in e.get('name', '').lower() for e in elements)
-        has_password = any(e['type'] == 'input' and e.get('input_type') == 'password' for e in elements)
-        has_login_button = any(e['type'] == 'button' and 'login' in e.get('text', '').lower() for e in elements)
+        has_email = 'email' in first
+        has_password = 'password' in first
         
-        if has_email and has_password and has_login_button:
+        if has_email and has_password and 'login_btn' in first:
             workflows.append({
                 'type': 'login',
                 'name': 'User Login Workflow',
                 'page': page_url,
-                'steps': self._build_login_workflow(elements)
+                'steps': _build_steps(_LOGIN_TEMPLATE, first)
             })
         
         # Detect registration workflow
-        has_register_button = any(e['type'] == 'button' and any(word in e.get('text', '').lower() for word in ['register', 'sign up', 'signup']) for e in elements)
-        if has_email and has_password and has_register_button:
+        if has_email and has_password and 'register_btn' in first:
             workflows.append({
                 'type': 'registration',
                 'name': 'User Registration Workflow',
                 'page': page_url,
-                'steps': self._build_registration_workflow(elements)
+                'steps': _build_steps(_REGISTRATION_TEMPLATE, first)
             })
         
         # Detect contact form workflow
-        has_name = any(e['type'] == 'input' and 'name' in e.get('name', '').lower() for e in elements)
-        has_message = any(e['type'] == 'textarea' for e in elements)
-        has_submit = any(e['type'] == 'button' and any(word in e.get('text', '').lower() for word in ['submit', 'send']) for e in elements)
-        
-        if has_name and (has_email or has_message) and has_submit:
+        if 'name' in first and (has_email or 'message' in first) and 'submit_btn' in first:
             workflows.append({
                 'type': 'contact_form',
                 'name': 'Contact Form Submission Workflow',
                 'page': page_url,
-                'steps': self._build_contact_workflow(elements)
+                'steps': _build_steps(_CONTACT_TEMPLATE, first)
             })
         
         # Detect search workflow
-        has_search = any(e['type'] == 'input' and any(word in e.get('placeholder', '').lower() for word in ['search', 'find']) for e in elements)
-        if has_search:
+        if 'search' in first:
             workflows.append({
                 'type': 'search',
                 'name': 'Search Workflow',
                 'page': page_url,
-                'steps': self._build_search_workflow(elements)
+                'steps': _build_steps(_SEARCH_TEMPLATE, first)
             })
         
         self.workflows.extend(workflows)
         return workflows
     
-    def _build_login_workflow(self, elements):
-        """Build login workflow steps"""
-        email_field = next((e for e in elements if e['type'] == 'input' and 'email' in e.get('name', '').lower()), None)
-        password_field = next((e for e in elements if e['type'] == 'input' and e.get('input_type') == 'password'), None)
-        submit_button = next((e for e in elements if e['type'] == 'button' and 'login' in e.get('text', '').lower()), None)
-        
-        steps = []
-        if email_field:
-            steps.append({
-                'action': 'fill',
-                'selector': email_field['selector'],
-                'data': 'testuser@example.com',
-                'description': 'Enter email address'
-            })
-        if password_field:
-            steps.append({
-                'action': 'fill',
-                'selector': password_field['selector'],
-                'data': 'TestPassword123!',
-                'description': 'Enter password'
-            })
-        if submit_button:
-            steps.append({
-                'action': 'click',
-                'selector': submit_button['selector'],
-                'data': '',
-                'description': 'Click login button'
-            })
-        
-        return steps
-    
-    def _build_registration_workflow(self, elements):
-        """Build registration workflow steps"""
-        steps = []
-        
-        name_field = next((e for e in elements if e['type'] == 'input' and 'name' in e.get('name', '').lower() and 'email' not in e.get('name', '').lower()), None)
-        email_field = next((e for e in elements if e['type'] == 'input' and 'email' in e.get('name', '').lower()), None)
-        password_field = next((e for e in elements if e['type'] == 'input' and e.get('input_type') == 'password'), None)
-        submit_button = next((e for e in elements if e['type'] == 'button' and any(word in e.get('text', '').lower() for word in ['register', 'sign up', 'signup'])), None)
-        
-        if name_field:
-            steps.append({
-                'action': 'fill',
-                'selector': name_field['selector'],
-                'data': 'John Doe',
-                'description': 'Enter full name'
-            })
-        if email_field:
-            steps.append({
-                'action': 'fill',
-                'selector': email_field['selector'],
-                'data': 'newuser@example.com',
-                'description': 'Enter email address'
-            })
-        if password_field:
-            steps.append({
-                'action': 'fill',
-                'selector': password_field['selector'],
-                'data': 'SecurePass123!',
-                'description': 'Enter password'
-            })
-        if submit_button:
-            steps.append({
-                'action': 'click',
-                'selector': submit_button['selector'],
-                'data': '',
-                'description': 'Click registration button'
-            })
-        
-        return steps
-    
-    def _build_contact_workflow(self, elements):
-        """Build contact form workflow steps"""
-        steps = []
-        
-        name_field = next((e for e in elements if e['type'] == 'input' and 'name' in e.get('name', '').lower()), None)
-        email_field = next((e for e in elements if e['type'] == 'input' and 'email' in e.get('name', '').lower()), None)
-        message_field = next((e for e in elements if e['type'] == 'textarea'), None)
-        submit_button = next((e for e in elements if e['type'] == 'button' and any(word in e.get('text', '').lower() for word in ['submit', 'send'])), None)
-        
-        if name_field:
-            steps.append({
-                'action': 'fill',
-                'selector': name_field['selector'],
-                'data': 'Jane Smith',
-                'description': 'Enter name'
-            })
-        if email_field:
-            steps.append({
-                'action': 'fill',
-                'selector': email_field['selector'],
-                'data': 'jane@example.com',
-                'description': 'Enter email'
-            })
-        if message_field:
-            steps.append({
-                'action': 'fill',
-                'selector': message_field['selector'],
-                'data': 'This is a test message for the contact form.',
-                'description': 'Enter message'
-            })
-        if submit_button:
-            steps.append({
-                'action': 'click',
-                'selector': submit_button['selector'],
-                'data': '',
-                'description': 'Submit form'
-            })
-        
-        return steps
-    
-    def _build_search_workflow(self, elements):
-        """Build search workflow steps"""
-        steps = []
-        
-        search_field = next((e for e in elements if e['type'] == 'input' and any(word in e.get('placeholder', '').lower() for word in ['search', 'find'])), None)
-        search_button = next((e for e in elements if e['type'] == 'button' and 'search' in e.get('text', '').lower()), None)
-        
-        if search_field:
-            steps.append({
-                'action': 'fill',
-                'selector': search_field['selector'],
-                'data': 'test query',
-                'description': 'Enter search query'
-            })
-        if search_button:
-            steps.append({
-                'action': 'click',
-                'selector': search_button['selector'],
-                'data': '',
-                'description': 'Click search button'
-            })
-        
-        return steps
-    
     def execute_workflow(self, workflow, url):
         """Execute a complete workflow"""
         result = {
@@ -218,16 +158,22 @@ class WorkflowTester:
         
         # Navigate to page
         self.browser.driver.get(url)
-        time.sleep(2)
+        self._wait_for_page_ready()
         
-        # Take screenshot before workflow
-        screenshot_before = self.browser.take_screenshot(
-            f"{workflow['type']}_before",
-            workflow['type']
-        )
+        # Take screenshot before workflow (once per page and workflow type)
+        cache_key = (url, workflow['type'])
+        screenshot_before = self._screenshot_cache.get(cache_key)
+        if screenshot_before is None:
+            screenshot_before = self.browser.take_screenshot(
+                f"{workflow['type']}_before",
+                workflow['type']
+            )
+            if screenshot_before:
+                self._screenshot_cache[cache_key] = screenshot_before
         
         # Execute each step
-        for idx, step in enumerate(workflow['steps'], 1):
+        steps = workflow['steps']
+        for idx, step in enumerate(steps, 1):
             step_result = {
                 'step_number': idx,
                 'description': step['description'],
@@ -253,7 +199,8 @@ class WorkflowTester:
                 break  # Stop workflow on first failure
             
             result['step_results'].append(step_result)
-            time.sleep(1)
+            if idx < len(steps):
+                self._wait_for_step(steps[idx])
         
         # Take screenshot after workflow
         screenshot_after = self.browser.take_screenshot(
@@ -268,6 +215,32 @@ class WorkflowTester:
         
         return result
     
+    def _wait_for_page_ready(self, timeout=10):
+        """Wait until the document has finished loading"""
+        try:
+            WebDriverWait(self.browser.driver, timeout).until(
+                lambda d: d.execute_script('return document.readyState') == 'complete'
+            )
+        except TimeoutException:
+            pass
+    
+    def _wait_for_step(self, step):
+        """Wait until the next step's element is clickable, for no longer than the adaptive pause"""
+        start = time.time()
+        try:
+            WebDriverWait(self.browser.driver, self._avg_step_wait, poll_frequency=0.05).until(
+                EC.element_to_be_clickable((By.CSS_SELECTOR, step['selector']))
+            )
+        except WebDriverException:
+            # No readiness signal (or an unusable selector / open alert) - allow longer next time
+            self._avg_step_wait = min(self._avg_step_wait * 2, 1.0)
+            return
+        
+        if time.time() - start <= 0.05:
+            self._avg_step_wait = max(self._avg_step_wait * 0.9, 0.01)
+        else:
+            self._avg_step_wait = min(self._avg_step_wait * 2, 1.0)
+    
     def generate_workflow_report(self, results):
         """Generate workflow test report"""
         lines = []
